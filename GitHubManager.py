@@ -5,15 +5,138 @@ import json
 import threading
 import urllib.request
 import urllib.error
+import urllib.parse
 import base64
 import datetime
 import webbrowser
+import time
 import fnmatch
+import hashlib
+import gzip
+import io
+import collections
+import re
+import codecs
+import tempfile
+import mmap
+import queue
+import multiprocessing
+import heapq
+import bisect
+import sys
+import traceback
+import functools
+import contextlib
+import cProfile
+import pstats
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 # Configuration
 CONFIG_FILE = "manager_config.json"
+SESSION_FILE = "manager_session.json" # Last session snapshot, shown instantly on launch
+CONNECT_WORKERS = 5 # Parallel requests when (re)connecting
+DASHBOARD_WORKERS = 6 # Bounded pool for multi-repo refresh/bulk operations
+
+# Local caches
+CACHE_DIR = "cache"
+BLOB_CACHE_DIR = os.path.join(CACHE_DIR, "blobs")
+BLOB_CACHE_MAX_BYTES = 512 * 1024 * 1024 # LRU eviction above this size
+COMMIT_CACHE_DIR = os.path.join(CACHE_DIR, "commits")
+TREE_CACHE_DIR = os.path.join(CACHE_DIR, "trees") # Tree listings by tree SHA, shared by every ref
+JOURNAL_DIR = "journal" # Plan + completed items of running bulk jobs, left behind if the app stops mid-way
+JOURNAL_FSYNC_EVERY = 32 # Done lines are flushed each time, forced to disk every N lines
+
+# History tab
+HISTORY_PAGE_SIZE = 100 # Commits per request
+HISTORY_VISIBLE_ROWS = 25 # Rows actually rendered, reused while scrolling
 DEFAULT_REPO = "" # Example: "Owner/RepoName"
 
+# Git LFS
+LFS_POINTER_VERSION = "https://git-lfs.github.com/spec/v1"
+LFS_MEDIA_TYPE = "application/vnd.git-lfs+json"
+LFS_WORKERS = 4 # Parallel object transfers
+LFS_CHUNK_SIZE = 1024 * 1024 # Streaming chunk (1 MB)
+
+# Release asset downloads
+ASSET_DOWNLOAD_WORKERS = 4 # Parallel connections per asset
+ASSET_SEGMENT_SIZE = 16 * 1024 * 1024 # Byte range fetched by one request (16 MB)
+ASSET_SEGMENT_RETRIES = 3 # Attempts per segment before the download is reported as failed
+
+# New repository seeding
+SEED_BLOB_WORKERS = 8 # Parallel blob uploads
+
+# Local pre-scan
+SCAN_WALK_WORKERS = 8 # Threads listing directories
+SCAN_HASH_WORKERS = None # Hashing processes (None = one per CPU)
+SCAN_MMAP_THRESHOLD = 4 * 1024 * 1024 # Files from this size are hashed through mmap
+SCAN_BATCH_FILES = 64 # Small files are hashed in batches to amortize process round-trips
+SCAN_BATCH_BYTES = 16 * 1024 * 1024
+
+# Remote filename search
+SEARCH_MAX_RESULTS = 50
+SEARCH_MAX_CANDIDATES = 3000 # Best trigram matches that get the (slower) fuzzy scoring
+SEARCH_MIN_CANDIDATES = 50 # Fewer trigram matches than this: also look for abbreviations ("gmgr")
+SEARCH_DEBOUNCE_MS = 150 # Wait for a typing pause before querying
+SEARCH_HEAD_CHECK_SECONDS = 30 # Minimum delay between two checks of the branch head
+SEARCH_COMPARE_MAX_FILES = 300 # The compare API lists at most 300 files, beyond that rescan the tree
+
+# Remote file preview
+PREVIEW_CHUNK_SIZE = 64 * 1024 # Bytes fetched per ranged request
+PREVIEW_HIGHLIGHT_LIMIT = 256 * 1024 # Syntax colors only for text files up to this size
+PREVIEW_HEX_WIDTH = 16
+
+SYNTAX_KEYWORDS = {
+    "py": "False None True and as assert async await break class continue def del elif else except finally for from "
+          "global if import in is lambda nonlocal not or pass raise return try while with yield self",
+    "c": "auto bool break case catch char class const continue default delete do double else enum explicit extern false "
+         "final float for friend goto if import inline int interface long namespace new null nullptr operator override "
+         "package private protected public return short signed sizeof static struct super switch template this throw "
+         "true try typedef typename union unsigned using virtual void volatile while func go defer fn let mut impl pub "
+         "use mod match crate var",
+    "js": "async await break case catch class const continue debugger default delete do else export extends false finally "
+          "for from function if import in instanceof interface let new null of return super switch this throw true try "
+          "type typeof undefined var void while yield",
+    "sh": "if then else elif fi for in do done while until case esac function return export local echo set call goto "
+          "exit rem",
+}
+# extension -> (keyword set, line comment prefix, has /* */ comments)
+SYNTAX_BY_EXT = {
+    ".py": ("py", "#", False), ".pyw": ("py", "#", False),
+    ".c": ("c", "//", True), ".h": ("c", "//", True), ".cpp": ("c", "//", True), ".hpp": ("c", "//", True),
+    ".cs": ("c", "//", True), ".java": ("c", "//", True), ".go": ("c", "//", True), ".rs": ("c", "//", True),
+    ".js": ("js", "//", True), ".ts": ("js", "//", True), ".jsx": ("js", "//", True), ".tsx": ("js", "//", True),
+    ".sh": ("sh", "#", False), ".ps1": ("sh", "#", False), ".bat": ("sh", "::", False), ".cmd": ("sh", "::", False),
+    ".yml": (None, "#", False), ".yaml": (None, "#", False), ".toml": (None, "#", False), ".ini": (None, ";", False),
+    ".json": (None, None, False),
+}
+
+# Dry-run planner
+PLAN_DEFAULT_LATENCY = 0.5 # Seconds per API call until measured
+PLAN_DEFAULT_THROUGHPUT = 512 * 1024 # Upload bytes/s until measured
+PLAN_THROUGHPUT_MIN_BYTES = 256 * 1024 # Request bodies from this size measure throughput, smaller ones latency
+PLAN_COMMIT_CALLS = 5 # Ref + commit + tree + commit + ref update for one Git Data commit
+
+# Profiling
+PROFILE_DIR = "profiles" # .prof/.txt reports and lag.log
+PROFILE_TOP_N = 40 # Functions listed in the text report
+PROFILE_OPERATIONS = ("refresh_local", "populate_remote", "list_remote", "api_request", "run_search", "render_history")
+LAG_HEARTBEAT_MS = 50 # Event loop heartbeat of the lag monitor
+LAG_THRESHOLD_MS = 150 # Main-thread stalls above this are recorded
+
+# Progress reporting
+PROGRESS_UI_INTERVAL_MS = 100 # UI refresh period for transfer progress (max 10 updates/s)
+PROGRESS_EWMA_ALPHA = 0.3 # Weight of the latest sample in the smoothed speed
+
+# API responses
+JSON_STREAM_CHUNK = 64 * 1024 # Decoded characters read per step when parsing responses
+JSON_NUMBER_START = "-0123456789"
+JSON_NUMBER_CHARS = "0123456789+-.eE" # Characters that can continue a number token
+
+# Lightweight records for large listings (trees, commit pages)
+TreeEntry = collections.namedtuple("TreeEntry", "path mode type sha size")
+CommitRecord = collections.namedtuple("CommitRecord", "sha message author date parents")
+
 class GitIgnoreChecker:
     def __init__(self, root_path):
         self.root_path = root_path
@@ -58,19 +181,1382 @@ class ProgressFileWrapper:
     def __init__(self, fileobj, total_size, callback):
         self.fileobj = fileobj
         self.total_size = total_size
-        self.callback = callback
+        self.callback = callback # Called with the size of each chunk read
         self.bytes_read = 0
 
     def read(self, size=-1):
         chunk = self.fileobj.read(size)
         if chunk:
             self.bytes_read += len(chunk)
-            self.callback(self.bytes_read, self.total_size)
+            self.callback(len(chunk))
         return chunk
 
     def __len__(self):
         return self.total_size
 
+class TransferProgress:
+    # Aggregated progress of all running transfers.
+    # Worker threads only bump counters under a lock, the UI thread samples it at a fixed rate.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0 # Running transfer jobs
+        self._reset()
+
+    def _reset(self):
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.items_total = 0
+        self.items_done = 0
+        self.speed = 0.0 # Smoothed bytes/s (EWMA)
+        self.message = None
+        self.message_seq = 0 # Bumped on every new message
+        self.last_time = time.monotonic()
+        self.last_bytes = 0
+
+    def begin(self, bytes_total=0, items_total=0, message=None):
+        with self.lock:
+            if self.active == 0:
+                self._reset()
+            self.active += 1
+            self.bytes_total += bytes_total
+            self.items_total += items_total
+            if message: self._set_message(message)
+
+    def end(self, message=None):
+        with self.lock:
+            self.active = max(0, self.active - 1)
+            if message: self._set_message(message)
+
+    def add_total(self, bytes_total=0, items_total=0):
+        # For jobs that discover their work while running (folder walks)
+        with self.lock:
+            self.bytes_total += bytes_total
+            self.items_total += items_total
+
+    def add_bytes(self, n, counted=True):
+        # counted=False for bytes that were not transferred now (resumed data), kept out of the speed
+        with self.lock:
+            self.bytes_done += n
+            if not counted:
+                self.last_bytes += n
+
+    def item_done(self, n=1):
+        with self.lock:
+            self.items_done += n
+
+    def _set_message(self, text):
+        self.message = text
+        self.message_seq += 1
+
+    def set_message(self, text):
+        with self.lock:
+            self._set_message(text)
+
+    def sample(self):
+        # Called from the UI thread, returns a snapshot dict with smoothed speed and ETA
+        with self.lock:
+            now = time.monotonic()
+            dt = now - self.last_time
+            if dt > 0:
+                instant = (self.bytes_done - self.last_bytes) / dt
+                self.speed = instant if self.speed == 0 else PROGRESS_EWMA_ALPHA * instant + (1 - PROGRESS_EWMA_ALPHA) * self.speed
+                self.last_time = now
+                self.last_bytes = self.bytes_done
+            remaining = max(0, self.bytes_total - self.bytes_done)
+            return {
+                "active": self.active,
+                "bytes_total": self.bytes_total,
+                "bytes_done": self.bytes_done,
+                "items_total": self.items_total,
+                "items_done": self.items_done,
+                "speed": self.speed,
+                "eta": remaining / self.speed if self.speed > 0 else 0,
+                "message": self.message,
+                "message_seq": self.message_seq
+            }
+
+class ApiStats:
+    # Measured cost of API requests (EWMA latency and upload throughput) and the last rate limit headers.
+    # Fed by every request, read by the dry-run planner.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency = None # Seconds per small request
+        self.throughput = None # Request body bytes/s
+        self.remaining = None
+        self.limit = None
+        self.reset = None # Epoch seconds
+
+    def record(self, sent, elapsed, headers):
+        with self.lock:
+            if sent >= PLAN_THROUGHPUT_MIN_BYTES:
+                rate = sent / max(elapsed, 1e-3)
+                self.throughput = rate if self.throughput is None else self.throughput + PROGRESS_EWMA_ALPHA * (rate - self.throughput)
+            else:
+                self.latency = elapsed if self.latency is None else self.latency + PROGRESS_EWMA_ALPHA * (elapsed - self.latency)
+            if headers and headers.get("X-RateLimit-Remaining"):
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+                self.limit = int(headers.get("X-RateLimit-Limit") or 0) or None
+                self.reset = int(headers.get("X-RateLimit-Reset") or 0) or None
+
+    def estimate(self, calls, nbytes):
+        # Seconds for a sequential job of calls requests sending nbytes in total
+        with self.lock:
+            latency = self.latency or PLAN_DEFAULT_LATENCY
+            throughput = self.throughput or PLAN_DEFAULT_THROUGHPUT
+        return calls * latency + nbytes / throughput
+
+    def describe(self, calls, nbytes):
+        # Human readable cost block for confirmation dialogs
+        with self.lock:
+            remaining, limit, reset = self.remaining, self.limit, self.reset
+            measured = self.latency is not None
+            latency = self.latency or PLAN_DEFAULT_LATENCY
+            throughput = self.throughput or PLAN_DEFAULT_THROUGHPUT
+        eta = str(datetime.timedelta(seconds=int(self.estimate(calls, nbytes))))
+        lines = [f"API calls: ~{calls}", f"Data to send: {format_size(nbytes)}",
+                 f"Estimated duration: {eta} ({latency:.2f} s/call, {format_size(throughput)}/s{'' if measured else ', not measured yet'})"]
+        if remaining is None:
+            lines.append("Rate limit: unknown")
+        else:
+            reset_str = datetime.datetime.fromtimestamp(reset).strftime('%H:%M') if reset else "?"
+            lines.append(f"Rate limit left: {remaining}/{limit or '?'} (resets at {reset_str})")
+            if calls > remaining:
+                lines.insert(0, f"⚠️ NOT ENOUGH RATE LIMIT: the job would stop after ~{remaining} calls.\n")
+        return "\n".join(lines)
+
+class GitAttributesChecker:
+    # Reads .gitattributes to know which paths are tracked by Git LFS
+    def __init__(self, root_path):
+        self.root_path = root_path
+        self.patterns = [] # (pattern, is_lfs), later lines win like in git
+        self.load_gitattributes()
+
+    def load_gitattributes(self):
+        attr_path = os.path.join(self.root_path, ".gitattributes")
+        if os.path.exists(attr_path):
+            try:
+                with open(attr_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        parts = line.strip().split()
+                        if not parts or parts[0].startswith('#'):
+                            continue
+                        pattern, attrs = parts[0], parts[1:]
+                        if "filter=lfs" in attrs:
+                            self.patterns.append((pattern, True))
+                        elif "-filter" in attrs or "!filter" in attrs:
+                            self.patterns.append((pattern, False))
+            except Exception as e:
+                print(f"Error loading .gitattributes: {e}")
+
+    def is_lfs(self, rel_path):
+        rel_path = rel_path.replace('\\', '/')
+        if rel_path.startswith('./'):
+            rel_path = rel_path[2:]
+        name = rel_path.split('/')[-1]
+
+        tracked = False
+        for pattern, is_lfs in self.patterns:
+            # Patterns with a slash are anchored to the root, others match the file name anywhere
+            if '/' in pattern.rstrip('/'):
+                matched = fnmatch.fnmatch(rel_path, pattern.lstrip('/'))
+            else:
+                matched = fnmatch.fnmatch(name, pattern)
+            if matched:
+                tracked = is_lfs
+        return tracked
+
+def lfs_oid(path):
+    # Streams a file through SHA-256, returns (oid, size)
+    h = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(LFS_CHUNK_SIZE), b""):
+            h.update(chunk)
+            size += len(chunk)
+    return h.hexdigest(), size
+
+def make_lfs_pointer(oid, size):
+    return f"version {LFS_POINTER_VERSION}\noid sha256:{oid}\nsize {size}\n".encode()
+
+def parse_lfs_pointer(data):
+    # Returns (oid, size) if data is an LFS pointer file, else None
+    if len(data) > 1024 or not data.startswith(b"version https://git-lfs"):
+        return None
+    fields = {}
+    for line in data.decode('utf-8', 'replace').splitlines():
+        key, _, value = line.partition(' ')
+        fields[key] = value
+    oid = fields.get("oid", "")
+    if not oid.startswith("sha256:") or not fields.get("size", "").isdigit():
+        return None
+    return oid[len("sha256:"):], int(fields["size"])
+
+class LFSClient:
+    # Minimal Git LFS client (batch API + "basic" transfer adapter)
+    # endpoint is the LFS server root, e.g. https://github.com/Owner/Repo.git/info/lfs
+    def __init__(self, endpoint, auth_header, progress=None):
+        self.endpoint = endpoint.rstrip('/')
+        self.auth_header = auth_header
+        self.progress = progress # Optional callback with the number of bytes moved
+
+    def batch(self, operation, objects):
+        data = {
+            "operation": operation,
+            "transfers": ["basic"],
+            "objects": [{"oid": oid, "size": size} for oid, size in objects],
+            "hash_algo": "sha256"
+        }
+        req = urllib.request.Request(f"{self.endpoint}/objects/batch", data=json.dumps(data).encode(), method="POST")
+        req.add_header("Authorization", self.auth_header)
+        req.add_header("Accept", LFS_MEDIA_TYPE)
+        req.add_header("Content-Type", LFS_MEDIA_TYPE)
+        with urllib.request.urlopen(req) as r:
+            res = json.loads(r.read().decode())
+        return {obj['oid']: obj for obj in res.get("objects", [])}
+
+    def upload(self, files):
+        # files: list of (local_path, oid, size). Objects already on the server are skipped.
+        objs = self.batch("upload", [(oid, size) for _, oid, size in files])
+        errors = []
+        with ThreadPoolExecutor(max_workers=LFS_WORKERS) as pool:
+            futures = {}
+            for path, oid, size in files:
+                obj = objs.get(oid, {})
+                if obj.get("error"):
+                    errors.append(f"{os.path.basename(path)}: {obj['error'].get('message')}")
+                elif "upload" in obj.get("actions", {}):
+                    futures[pool.submit(self._upload_object, path, oid, size, obj['actions'])] = path
+                elif self.progress:
+                    self.progress(size, False) # Already on the server
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception as e:
+                    errors.append(f"{os.path.basename(futures[fut])}: {e}")
+        if errors:
+            raise Exception("LFS upload failed:\n" + "\n".join(errors))
+
+    def _upload_object(self, path, oid, size, actions):
+        action = actions['upload']
+        with open(path, 'rb') as f:
+            body = ProgressFileWrapper(f, size, self.progress) if self.progress else f
+            req = urllib.request.Request(action['href'], data=body, method="PUT")
+            for k, v in action.get("header", {}).items():
+                req.add_header(k, v)
+            req.add_header("Content-Type", "application/octet-stream")
+            req.add_header("Content-Length", str(size))
+            with urllib.request.urlopen(req) as r:
+                r.read()
+
+        if "verify" in actions:
+            verify = actions['verify']
+            req = urllib.request.Request(verify['href'], data=json.dumps({"oid": oid, "size": size}).encode(), method="POST")
+            for k, v in verify.get("header", {}).items():
+                req.add_header(k, v)
+            req.add_header("Accept", LFS_MEDIA_TYPE)
+            req.add_header("Content-Type", LFS_MEDIA_TYPE)
+            with urllib.request.urlopen(req) as r:
+                r.read()
+
+    def download(self, items):
+        # items: list of (oid, size, dest_path)
+        objs = self.batch("download", [(oid, size) for oid, size, _ in items])
+        errors = []
+        with ThreadPoolExecutor(max_workers=LFS_WORKERS) as pool:
+            futures = {}
+            for oid, size, dest in items:
+                obj = objs.get(oid, {})
+                if obj.get("error") or "download" not in obj.get("actions", {}):
+                    msg = obj.get("error", {}).get("message", "object not available")
+                    errors.append(f"{os.path.basename(dest)}: {msg}")
+                else:
+                    futures[pool.submit(self._download_object, oid, size, dest, obj['actions']['download'])] = dest
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception as e:
+                    errors.append(f"{os.path.basename(futures[fut])}: {e}")
+        if errors:
+            raise Exception("LFS download failed:\n" + "\n".join(errors))
+
+    def _download_object(self, oid, size, dest, action):
+        req = urllib.request.Request(action['href'])
+        for k, v in action.get("header", {}).items():
+            req.add_header(k, v)
+
+        # Stream to a temp file and only replace the target once the hash matches
+        tmp_path = dest + ".lfs-tmp"
+        h = hashlib.sha256()
+        received = 0
+        try:
+            with urllib.request.urlopen(req) as r, open(tmp_path, 'wb') as f:
+                for chunk in iter(lambda: r.read(LFS_CHUNK_SIZE), b""):
+                    h.update(chunk)
+                    f.write(chunk)
+                    received += len(chunk)
+                    if self.progress: self.progress(len(chunk))
+            if received != size or h.hexdigest() != oid:
+                raise Exception(f"verification failed (got {received} bytes, sha256 {h.hexdigest()[:12]})")
+            os.replace(tmp_path, dest)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+def git_blob_sha(data):
+    # Same id git gives to a file content: SHA-1 of "blob <len>" + NUL + data
+    h = hashlib.sha1(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+def hash_file_blob(path):
+    # git blob SHA of a file without loading big files in memory
+    size = os.path.getsize(path)
+    h = hashlib.sha1(b"blob %d\0" % size)
+    with open(path, 'rb') as f:
+        if size >= SCAN_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                h.update(m)
+        elif size:
+            h.update(f.read())
+    return h.hexdigest()
+
+def _hash_batch(paths):
+    # Runs in a worker process, returns [(path, size, blob_sha or None)]
+    results = []
+    for path in paths:
+        try:
+            results.append((path, os.path.getsize(path), hash_file_blob(path)))
+        except OSError as e:
+            print(f"Hash error for {path}: {e}")
+            results.append((path, 0, None))
+    return results
+
+class TreeScanner:
+    # Pre-scan of a local folder: directories are listed by a thread pool, files are hashed in a process pool.
+    # Iterating yields (local_path, size, blob_sha) as soon as each batch is ready, so work can start before the scan ends.
+    # checker filters paths relative to base_path (gitignore), ignored files are counted in self.skipped.
+    def __init__(self, folder, checker, base_path):
+        self.folder = folder
+        self.checker = checker
+        self.base_path = base_path
+        self.skipped = 0
+        self.out = queue.Queue()
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.done = object() # Sentinel
+
+    def _started(self):
+        with self.lock:
+            self.pending += 1
+
+    def _finished(self):
+        with self.lock:
+            self.pending -= 1
+            if self.pending == 0:
+                self.out.put(self.done)
+
+    def _scan_dir(self, path):
+        try:
+            batch = []
+            batch_bytes = 0
+            with os.scandir(path) as it:
+                for entry in it:
+                    rel = os.path.relpath(entry.path, self.base_path)
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self.checker.is_ignored(rel):
+                            self._started()
+                            self.walk_pool.submit(self._scan_dir, entry.path)
+                    elif entry.is_file():
+                        if self.checker.is_ignored(rel):
+                            print(f"Skipping ignored file: {rel}")
+                            with self.lock:
+                                self.skipped += 1
+                            continue
+                        batch.append(entry.path)
+                        batch_bytes += entry.stat().st_size
+                        if len(batch) >= SCAN_BATCH_FILES or batch_bytes >= SCAN_BATCH_BYTES:
+                            self._hash(batch)
+                            batch, batch_bytes = [], 0
+            if batch:
+                self._hash(batch)
+        except Exception as e:
+            print(f"Scan error in {path}: {e}")
+        finally:
+            self._finished()
+
+    def _hash(self, batch):
+        self._started()
+        try:
+            fut = self.hash_pool.submit(_hash_batch, batch)
+        except Exception as e:
+            # Broken pool (a worker died): hash here, the batch must still be counted as finished
+            print(f"Hash pool unavailable, hashing in thread: {e}")
+            self._hash_here(batch)
+            return
+        fut.add_done_callback(lambda f: self._hashed(f, batch))
+
+    def _hashed(self, fut, batch):
+        try:
+            results = fut.result()
+        except Exception as e:
+            print(f"Hash batch failed, hashing in thread: {e}")
+            self._hash_here(batch)
+            return
+        self.out.put(results)
+        self._finished()
+
+    def _hash_here(self, batch):
+        # Fallback for a failed batch. Files that still cannot be hashed are yielded without size/sha,
+        # like directly selected files: the caller hashes them itself and reports its own errors.
+        try:
+            self.out.put(_hash_batch(batch))
+        except Exception as e:
+            print(f"Hash batch failed: {e}")
+            self.out.put([(path, None, None) for path in batch])
+        finally:
+            self._finished()
+
+    def __iter__(self):
+        self.walk_pool = ThreadPoolExecutor(max_workers=SCAN_WALK_WORKERS)
+        try:
+            # spawn: never fork a process that runs Tk and threads
+            self.hash_pool = ProcessPoolExecutor(max_workers=SCAN_HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        except Exception as e:
+            print(f"Process pool unavailable, hashing in threads: {e}")
+            self.hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+        try:
+            self._started()
+            self.walk_pool.submit(self._scan_dir, self.folder)
+            while True:
+                results = self.out.get()
+                if results is self.done:
+                    return
+                yield from results
+        finally:
+            self.walk_pool.shutdown(wait=False, cancel_futures=True)
+            self.hash_pool.shutdown(wait=False, cancel_futures=True)
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def fuzzy_score(query, name, path, overlap=None):
+    # Higher is better, None if name does not match query at all.
+    # overlap: share of query trigrams found in name, when already known
+    if name == query:
+        return 1000
+    if name.startswith(query):
+        return 800 - len(name)
+    pos = name.find(query)
+    if pos >= 0:
+        return 600 - pos - len(name) // 10
+    # Subsequence match (e.g. "gmgr" -> "githubmanager"), fewer gaps is better
+    gaps = 0
+    last = -1
+    for ch in query:
+        idx = name.find(ch, last + 1)
+        if idx < 0:
+            break
+        gaps += idx - last - 1
+        last = idx
+    else:
+        return 400 - gaps - len(path) // 20
+    # Typos: share of trigrams in common
+    if overlap is None:
+        q = trigrams(query)
+        overlap = len(q & trigrams(name)) / len(q) if q else 0
+    if overlap >= 0.5:
+        return int(100 * overlap) - len(path) // 20
+    return None
+
+class PathIndex:
+    # Trigram index over file names for instant fuzzy search on large trees.
+    # Posting lists are compact arrays of path ids, removed paths are tombstoned and skipped.
+    def __init__(self):
+        self.paths = [] # id -> path, None once removed
+        self.names = [] # id -> lowercase file name
+        self.ids = {} # path -> id
+        self.grams = {} # trigram -> array of ids
+        self.removed = 0
+        self.tree_sha = None # Tree the index reflects
+        self.commit_sha = None
+        self._text = None # (all names joined by newlines, line start offsets), built on demand
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, path):
+        if path in self.ids: return
+        pid = len(self.paths)
+        name = path.rsplit('/', 1)[-1].lower()
+        self.paths.append(path)
+        self.names.append(name)
+        self.ids[path] = pid
+        self._text = None
+        for g in trigrams(name):
+            posting = self.grams.get(g)
+            if posting is None:
+                posting = self.grams[g] = array('I')
+            posting.append(pid)
+
+    def remove(self, path):
+        pid = self.ids.pop(path, None)
+        if pid is None: return
+        self.paths[pid] = None
+        self.removed += 1
+        if self.removed > len(self.ids):
+            self._compact()
+
+    def _compact(self):
+        # Too many tombstones: rebuild the postings
+        live = [p for p in self.paths if p is not None]
+        self.paths, self.names, self.ids, self.grams, self.removed = [], [], {}, {}, 0
+        for p in live:
+            self.add(p)
+
+    def copy(self):
+        # Independent index to patch off the UI thread while this one keeps serving searches
+        other = PathIndex()
+        other.paths = list(self.paths)
+        other.names = list(self.names)
+        other.ids = dict(self.ids)
+        other.grams = {g: posting[:] for g, posting in self.grams.items()}
+        other.removed = self.removed
+        other.tree_sha = self.tree_sha
+        other.commit_sha = self.commit_sha
+        return other
+
+    def _subsequence_ids(self, query, limit):
+        # Ids whose name contains the query letters in order, found by one regex pass over all names
+        if self._text is None:
+            starts = array('I')
+            pos = 0
+            for name in self.names:
+                starts.append(pos)
+                pos += len(name) + 1
+            self._text = ("\n".join(self.names) + "\n", starts)
+        text, starts = self._text
+        # First letter, then each next letter with [^\nc]*c (no backtracking, never crosses a line)
+        pattern = re.compile(re.escape(query[0]) + "".join(f"[^\\n{re.escape(ch)}]*{re.escape(ch)}" for ch in query[1:]))
+        found = {}
+        for m in pattern.finditer(text):
+            found[bisect.bisect_right(starts, m.start()) - 1] = True
+            if len(found) >= limit:
+                break
+        return list(found)
+
+    def search(self, query, limit=SEARCH_MAX_RESULTS):
+        # Returns up to limit paths, best first. "dir/name" queries also filter on the directory part.
+        query = query.strip().lower().replace('\\', '/')
+        if not query: return []
+        dir_q, _, name_q = query.rpartition('/')
+        if not name_q:
+            name_q, dir_q = dir_q, ""
+        
+        grams = trigrams(name_q)
+        if grams:
+            # Very common trigrams (".py", "src") barely filter anything: skip them while rarer ones remain.
+            # Trigrams found nowhere (typos) do not make the others harder to match.
+            postings = sorted((p for p in (self.grams.get(g) for g in grams) if p), key=len)
+            common_limit = max(1000, len(self.paths) // 20)
+            used = [p for p in postings if len(p) <= common_limit] or postings[:1]
+            share = len(grams) - (len(postings) - len(used)) # Query trigrams that could have matched
+            if not used:
+                counts = {}
+            elif len(used) == 1:
+                counts = dict.fromkeys(used[0], 1) # Nothing to count
+            else:
+                counts = collections.Counter()
+                for posting in used:
+                    counts.update(posting)
+            # Candidates share at least half of the query trigrams (tolerates typos), best overlaps first
+            need = max(1, (len(used) + 1) // 2)
+            matches = ((c, pid) for pid, c in counts.items() if c >= need)
+            if dir_q:
+                matches = ((c, pid) for c, pid in matches if self.paths[pid] and dir_q in self.paths[pid].lower())
+            candidates = [(pid, c / share) for c, pid in heapq.nlargest(SEARCH_MAX_CANDIDATES, matches)]
+            if len(candidates) < SEARCH_MIN_CANDIDATES:
+                # Abbreviations share no trigram with the name, only the letter order
+                seen = {pid for pid, _ in candidates}
+                candidates += [(pid, None) for pid in self._subsequence_ids(name_q, SEARCH_MAX_CANDIDATES) if pid not in seen]
+        else:
+            # 1-2 characters: plain scan of the names
+            candidates = [(pid, None) for pid, name in enumerate(self.names) if name_q in name]
+        
+        scored = []
+        for pid, overlap in candidates:
+            path = self.paths[pid]
+            if path is None: continue
+            if dir_q and dir_q not in path.lower(): continue
+            score = fuzzy_score(name_q, self.names[pid], path, overlap)
+            if score is not None:
+                scored.append((score, -len(path), path))
+        return [path for _, _, path in heapq.nlargest(limit, scored)]
+
+def looks_binary(data):
+    # NUL bytes or lots of control characters in the first bytes
+    sample = data[:8192]
+    if b"\0" in sample:
+        return True
+    if not sample:
+        return False
+    control = sum(1 for b in sample if b < 32 and b not in (9, 10, 12, 13, 27))
+    return control / len(sample) > 0.1
+
+def hex_dump(data, offset=0):
+    lines = []
+    for i in range(0, len(data), PREVIEW_HEX_WIDTH):
+        row = data[i:i + PREVIEW_HEX_WIDTH]
+        hexes = " ".join(f"{b:02x}" for b in row)
+        text = "".join(chr(b) if 32 <= b < 127 else "." for b in row)
+        lines.append(f"{offset + i:08x}  {hexes:<{PREVIEW_HEX_WIDTH * 3}} {text}")
+    return "\n".join(lines) + "\n"
+
+def syntax_spans(text, ext):
+    # [(tag, start, end)] character spans for a simple regex highlighter, later tags win
+    lang, line_comment, block_comment = SYNTAX_BY_EXT.get(ext, (None, None, False))
+    spans = []
+    if lang:
+        words = "|".join(SYNTAX_KEYWORDS[lang].split())
+        spans += [("keyword", m.start(), m.end()) for m in re.finditer(rf"\b(?:{words})\b", text)]
+    spans += [("number", m.start(), m.end()) for m in re.finditer(r"\b\d+(?:\.\d+)?\b", text)]
+    spans += [("string", m.start(), m.end()) for m in re.finditer(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'', text)]
+    if line_comment:
+        spans += [("comment", m.start(), m.end()) for m in re.finditer(re.escape(line_comment) + r"[^\n]*", text)]
+    if block_comment:
+        spans += [("comment", m.start(), m.end()) for m in re.finditer(r"/\*.*?\*/", text, re.S)]
+    return spans
+
+class RemotePreview:
+    # Preview window for a remote file: only the first chunk is fetched, more chunks are
+    # requested with HTTP Range when scrolling near the end. Binary files are shown as hex.
+    def __init__(self, app, path, sha, size, url, headers):
+        self.app = app
+        self.path = path
+        self.sha = sha
+        self.size = size # May be refined from Content-Range
+        self.url = url
+        self.headers = headers
+        self.loaded = 0
+        self.loading = False
+        self.binary = None
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        
+        self.win = tk.Toplevel(app.root)
+        self.win.title(f"Preview - {path}")
+        self.win.geometry("900x600")
+        self.lbl_info = tk.Label(self.win, text="Loading...", anchor=tk.W, fg="#666")
+        self.lbl_info.pack(fill=tk.X, padx=5, pady=2)
+        frame = tk.Frame(self.win)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.text = tk.Text(frame, wrap=tk.NONE, font=("Consolas", 9))
+        scroll = ttk.Scrollbar(frame, orient="vertical", command=self.text.yview)
+        self.text.configure(yscrollcommand=lambda first, last: [scroll.set(first, last), self._on_scroll(float(last))])
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.text.tag_configure("keyword", foreground="#0000cc")
+        self.text.tag_configure("number", foreground="#098658")
+        self.text.tag_configure("string", foreground="#a31515")
+        self.text.tag_configure("comment", foreground="#008000")
+        
+        # File already in the blob cache: no request at all, but still shown chunk by chunk
+        self.cached = app.blob_cache.get(sha)
+        if self.cached is not None:
+            self.size = len(self.cached)
+        self._fetch_next()
+
+    def _on_scroll(self, last):
+        if last > 0.9 and not self.loading and self.loaded < self.size:
+            self._fetch_next()
+
+    def _fetch_next(self):
+        self.loading = True
+        start = self.loaded
+        end = start + PREVIEW_CHUNK_SIZE - 1
+        if self.cached is not None:
+            self._append(self.cached[start:end + 1], len(self.cached))
+            return
+        
+        def _fetch():
+            try:
+                req = urllib.request.Request(self.url)
+                for k, v in self.headers.items():
+                    req.add_header(k, v)
+                req.add_header("Range", f"bytes={start}-{end}")
+                with urllib.request.urlopen(req) as r:
+                    total = self.size
+                    content_range = r.headers.get("Content-Range", "")
+                    if r.status == 206 and "/" in content_range:
+                        total = int(content_range.rsplit("/", 1)[1])
+                    # Without range support the server sends everything: keep only this chunk
+                    data = r.read(PREVIEW_CHUNK_SIZE) if r.status == 206 or start == 0 else b""
+                    if r.status != 206:
+                        total = start + len(data) if len(data) < PREVIEW_CHUNK_SIZE else max(total, start + len(data))
+                self.app.root.after(0, lambda: self._append(data, total))
+            except Exception as e:
+                self.app.root.after(0, lambda: self.lbl_info.config(text=f"Preview error: {e}"))
+        threading.Thread(target=_fetch, daemon=True).start()
+
+    def _append(self, data, total):
+        if not self.win.winfo_exists(): return
+        first = self.loaded == 0
+        self.size = total
+        if self.binary is None:
+            self.binary = looks_binary(data)
+        offset = self.loaded
+        self.loaded += len(data)
+        if not data:
+            self.size = self.loaded # Nothing more to read
+        
+        if self.binary:
+            self.text.insert(tk.END, hex_dump(data, offset))
+        else:
+            chunk = self.decoder.decode(data, final=self.loaded >= self.size)
+            self.text.insert(tk.END, chunk)
+            # Small text files: colorize once the whole content is here
+            if self.size <= PREVIEW_HIGHLIGHT_LIMIT and self.loaded >= self.size:
+                ext = os.path.splitext(self.path)[1].lower()
+                for tag, a, b in syntax_spans(self.text.get("1.0", "end-1c"), ext):
+                    self.text.tag_add(tag, f"1.0 + {a} chars", f"1.0 + {b} chars")
+        
+        # A complete small file is worth keeping
+        if first and self.loaded >= self.size and not self.app.blob_cache.has(self.sha):
+            self.app.blob_cache.put(self.sha, data)
+        
+        kind = "binary (hex)" if self.binary else "text"
+        done = " (complete)" if self.loaded >= self.size else " - scroll down to load more"
+        self.lbl_info.config(text=f"{self.path} | {kind} | {format_size(self.loaded)} of {format_size(self.size)}{done}")
+        self.loading = False
+        # Text small enough to colorize: fetch the remaining chunks without waiting for a scroll
+        if not self.binary and data and self.loaded < self.size <= PREVIEW_HIGHLIGHT_LIMIT:
+            self._fetch_next()
+
+def format_size(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.1f} {unit}" if unit != "B" else f"{n} B"
+        n /= 1024
+
+class BlobCache:
+    # Content-addressed store of file contents keyed by git blob SHA.
+    # Writes are atomic (temp file + rename), reads are verified, total size is capped with LRU eviction.
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict() # sha -> size, least recently used first
+        self.total = 0
+        self._scan()
+
+    def _path(self, sha):
+        return os.path.join(self.root, sha[:2], sha[2:])
+
+    def _scan(self):
+        if not os.path.isdir(self.root): return
+        found = []
+        for folder, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(folder, name)
+                try:
+                    if name.endswith(".tmp"):
+                        os.remove(path) # Leftover of an interrupted write
+                        continue
+                    st = os.stat(path)
+                    found.append((st.st_mtime, os.path.basename(folder) + name, st.st_size))
+                except OSError:
+                    pass
+        for _, sha, size in sorted(found):
+            self.entries[sha] = size
+            self.total += size
+        self._evict()
+
+    def _evict(self):
+        while self.total > self.max_bytes and self.entries:
+            sha, size = self.entries.popitem(last=False)
+            self.total -= size
+            try:
+                os.remove(self._path(sha))
+            except OSError:
+                pass
+
+    def _drop(self, sha):
+        with self.lock:
+            size = self.entries.pop(sha, None)
+            if size is not None:
+                self.total -= size
+        try:
+            os.remove(self._path(sha))
+        except OSError:
+            pass
+
+    def has(self, sha):
+        with self.lock:
+            return sha in self.entries
+
+    def get(self, sha):
+        if not sha or not self.has(sha): return None
+        path = self._path(sha)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self._drop(sha)
+            return None
+        if git_blob_sha(data) != sha:
+            print(f"Blob cache: corrupted entry {sha}, dropped")
+            self._drop(sha)
+            return None
+        with self.lock:
+            if sha in self.entries:
+                self.entries.move_to_end(sha)
+        try:
+            os.utime(path) # Keeps LRU order across restarts
+        except OSError:
+            pass
+        return data
+
+    def put(self, sha, data):
+        if not sha or len(data) > self.max_bytes: return
+        if git_blob_sha(data) != sha:
+            print(f"Blob cache: content does not match {sha}, not stored")
+            return
+        with self.lock:
+            if sha in self.entries:
+                self.entries.move_to_end(sha)
+                return
+        
+        path = self._path(sha)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path): os.remove(tmp_path)
+            raise
+        
+        with self.lock:
+            if sha not in self.entries:
+                self.entries[sha] = len(data)
+                self.total += len(data)
+            self._evict()
+
+class ObjectCache:
+    # JSON objects keyed by git SHA. Git objects never change, so entries are kept forever and never revalidated.
+    def __init__(self, root):
+        self.root = root
+        self.memory = {}
+        self.lock = threading.Lock()
+
+    def _path(self, sha):
+        return os.path.join(self.root, sha[:2], sha[2:] + ".json")
+
+    def get(self, sha):
+        with self.lock:
+            if sha in self.memory:
+                return self.memory[sha]
+        try:
+            with open(self._path(sha), 'r', encoding='utf-8') as f:
+                obj = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self.lock:
+            self.memory[sha] = obj
+        return obj
+
+    def put(self, sha, obj):
+        with self.lock:
+            self.memory[sha] = obj
+        path = self._path(sha)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(obj, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Object cache write error: {e}")
+
+class TransferJournal:
+    # Append-only JSONL file of one bulk job: first line is the plan, then one {"done": key} line per finished item.
+    # A job that ends cleanly removes its file, so whatever is left in JOURNAL_DIR was interrupted.
+    active = set() # Paths of journals owned by a running job
+
+    def __init__(self, path, plan, done=None):
+        self.path = path
+        self.plan = plan
+        self.done = done or set()
+        self.lock = threading.Lock()
+        self.unsynced = 0
+        self.f = None
+        TransferJournal.active.add(path)
+        try:
+            # A crash can leave a partial last line, start on a fresh one
+            needs_newline = os.path.exists(path) and os.path.getsize(path) > 0 and not self._ends_with_newline()
+            self.f = open(path, 'a', encoding='utf-8')
+            if needs_newline:
+                self.f.write("\n")
+        except OSError as e:
+            print(f"Journal unavailable, job will not be resumable: {e}")
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    @classmethod
+    def start(cls, kind, repo, **plan):
+        plan.update(kind=kind, repo=repo, created=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        os.makedirs(JOURNAL_DIR, exist_ok=True)
+        path = os.path.join(JOURNAL_DIR, f"{kind}-{time.time_ns()}.jsonl")
+        journal = cls(path, plan)
+        journal._write(plan, sync=True)
+        return journal
+
+    @classmethod
+    def pending(cls, repo):
+        # Interrupted journals of a repo, oldest first
+        found = []
+        if not os.path.isdir(JOURNAL_DIR):
+            return found
+        for name in sorted(os.listdir(JOURNAL_DIR)):
+            path = os.path.join(JOURNAL_DIR, name)
+            if not name.endswith(".jsonl") or path in cls.active:
+                continue
+            plan = None
+            done = set()
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            rec = json.loads(line)
+                        except ValueError:
+                            continue # Torn write
+                        if plan is None:
+                            plan = rec
+                        elif "done" in rec:
+                            done.add(rec["done"])
+            except OSError as e:
+                print(f"Cannot read journal {name}: {e}")
+                continue
+            if plan and plan.get("repo") == repo:
+                found.append((path, plan, done))
+        return found
+
+    def _write(self, rec, sync=False):
+        if not self.f: return
+        with self.lock:
+            try:
+                self.f.write(json.dumps(rec) + "\n")
+                self.f.flush()
+                self.unsynced += 1
+                if sync or self.unsynced >= JOURNAL_FSYNC_EVERY:
+                    os.fsync(self.f.fileno())
+                    self.unsynced = 0
+            except (OSError, ValueError) as e:
+                print(f"Journal write error: {e}")
+
+    def mark(self, key):
+        self.done.add(key)
+        self._write({"done": key})
+
+    def close(self, keep=False):
+        # keep=True leaves the journal for a later resume (job failed or had errors)
+        TransferJournal.active.discard(self.path)
+        if self.f:
+            try:
+                self.f.close()
+            except OSError:
+                pass
+            self.f = None
+        if not keep:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    # Lets us read the Location of a redirect instead of following it with our auth header
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+class SegmentedDownloader:
+    # Downloads url into a preallocated file with parallel byte-range requests.
+    # Finished segments are recorded in <dest>.part.json so a rerun only fetches the missing ones.
+    def __init__(self, url, size, dest, headers=None, progress=None,
+                 workers=ASSET_DOWNLOAD_WORKERS, segment_size=ASSET_SEGMENT_SIZE):
+        self.url = url
+        self.size = size
+        self.dest = dest
+        self.headers = headers or {}
+        self.progress = progress # Called with (bytes, counted) from worker threads
+        self.workers = workers
+        self.segment_size = segment_size
+        self.part_path = dest + ".part"
+        self.state_path = self.part_path + ".json"
+        self.lock = threading.Lock()
+        self.resumed = 0 # Bytes kept from a previous run
+
+    def _request(self, start=None, end=None):
+        req = urllib.request.Request(self.url)
+        for k, v in self.headers.items():
+            req.add_header(k, v)
+        if start is not None:
+            req.add_header("Range", f"bytes={start}-{end}")
+        return urllib.request.urlopen(req)
+
+    def _supports_ranges(self):
+        try:
+            with self._request(0, 0) as r:
+                return r.status == 206
+        except Exception:
+            return False
+
+    def _load_done(self):
+        # Segments finished by a previous run (only valid if the partial file is still there)
+        if not (os.path.exists(self.part_path) and os.path.exists(self.state_path)):
+            return set()
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+            if state.get("size") == self.size and state.get("segment_size") == self.segment_size:
+                return set(state.get("done", []))
+        except Exception as e:
+            print(f"Ignoring download state: {e}")
+        return set()
+
+    def _save_done(self, done):
+        with open(self.state_path, 'w') as f:
+            json.dump({"size": self.size, "segment_size": self.segment_size, "done": sorted(done)}, f)
+
+    def run(self):
+        # Returns the SHA-256 of the downloaded file
+        ranged = self.size > 0 and self._supports_ranges()
+        if not ranged:
+            self.segment_size = max(self.size, 1) # Single stream
+        
+        done = self._load_done() if ranged else set()
+        if not done:
+            # Preallocate the target so segments can be written at their offset
+            with open(self.part_path, 'wb') as f:
+                f.truncate(self.size)
+        
+        segments = [(i, start, min(start + self.segment_size, self.size) - 1)
+                    for i, start in enumerate(range(0, self.size, self.segment_size))]
+        self.resumed = sum(end - start + 1 for i, start, end in segments if i in done)
+        if self.progress and self.resumed:
+            self.progress(self.resumed, False)
+        
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.workers if ranged else 1) as pool:
+            futures = {pool.submit(self._fetch_segment, start, end, ranged): i
+                       for i, start, end in segments if i not in done}
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                    with self.lock:
+                        done.add(futures[fut])
+                        if ranged: self._save_done(done)
+                except Exception as e:
+                    failed.append(f"segment {futures[fut]}: {e}")
+        if failed:
+            raise Exception(f"{len(failed)} segment(s) failed, run again to resume:\n" + "\n".join(failed[:5]))
+        
+        # Verify size and compute checksum before publishing the file
+        actual = os.path.getsize(self.part_path)
+        if actual != self.size:
+            raise Exception(f"Size mismatch: expected {self.size}, got {actual}")
+        h = hashlib.sha256()
+        with open(self.part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(LFS_CHUNK_SIZE), b""):
+                h.update(chunk)
+        os.replace(self.part_path, self.dest)
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        return h.hexdigest()
+
+    def _fetch_segment(self, start, end, ranged):
+        offset = start
+        last_error = None
+        for attempt in range(ASSET_SEGMENT_RETRIES):
+            try:
+                # Retries continue from the last byte written, not from the segment start
+                with self._request(offset, end) if ranged else self._request() as r, open(self.part_path, 'r+b') as f:
+                    f.seek(offset)
+                    for chunk in iter(lambda: r.read(LFS_CHUNK_SIZE), b""):
+                        chunk = chunk[:end + 1 - offset]
+                        f.write(chunk)
+                        offset += len(chunk)
+                        if self.progress: self.progress(len(chunk))
+                        if offset > end: break
+                if offset > end:
+                    return
+                last_error = Exception(f"connection closed at byte {offset}")
+            except Exception as e:
+                last_error = e
+            if not ranged:
+                break # Can't resume without range support
+        raise last_error
+
+class JSONStreamReader:
+    # Incremental JSON decoder over a (possibly gzip) byte stream.
+    # iter_array holds only a small text window and decodes elements one by one,
+    # read_value leaves whole documents to the json module (faster, not larger in memory).
+    def __init__(self, stream, chunk_size=JSON_STREAM_CHUNK):
+        self.reader = io.TextIOWrapper(stream, encoding='utf-8')
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.fields = {} # Top-level scalar fields seen by iter_array (e.g. "truncated")
+
+    def _fill(self, min_size=0):
+        chunk = self.reader.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                break
+        return self.buf[self.pos] if self.pos < len(self.buf) else ""
+
+    def _expect(self, ch):
+        if self._peek() != ch:
+            raise ValueError(f"Malformed JSON stream: expected '{ch}'")
+        self.pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Value not complete yet: at least double the window, so a long string
+                # costs a linear number of rescans instead of one per chunk
+                if not self._fill(len(self.buf) - self.pos):
+                    raise
+                continue
+            # A number may go on in the next chunk ("1" + ".5", "2" + "e10"): it is only
+            # complete when a non-number character follows it, or at the end of the stream
+            if self.buf[self.pos] in JSON_NUMBER_START and (end == len(self.buf) or self.buf[end] in JSON_NUMBER_CHARS):
+                if self._fill():
+                    continue
+            self.pos = end
+            return obj
+
+    def _elements(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self._value()
+            c = self._peek()
+            self.pos += 1
+            if c == ']':
+                return
+            if c != ',':
+                raise ValueError("Malformed JSON stream: bad array")
+
+    def _members(self):
+        self._expect('{')
+        if self._peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            yield key
+            c = self._peek()
+            self.pos += 1
+            if c == '}':
+                return
+            if c != ',':
+                raise ValueError("Malformed JSON stream: bad object")
+
+    def read_value(self):
+        # Whole document at once
+        return json.loads(self.buf[self.pos:] + self.reader.read())
+
+    def iter_array(self, key=None):
+        # Yields elements of the top-level array, or of the array stored under key in the top-level object
+        if key is None:
+            yield from self._elements()
+            return
+        for k in self._members():
+            if k == key and self._peek() == '[':
+                yield from self._elements()
+            else:
+                self.fields[k] = self._value()
+
+def open_response_stream(response):
+    # Transparently decompresses gzip-encoded responses while streaming
+    if response.headers.get("Content-Encoding", "").lower() == "gzip":
+        return gzip.GzipFile(fileobj=response)
+    return response
+
+def parse_next_link(header):
+    # URL of rel="next" in a Link header (pagination cursor), or None
+    for part in (header or "").split(","):
+        m = re.match(r'\s*<([^>]+)>\s*;\s*rel="next"', part)
+        if m:
+            return m.group(1)
+    return None
+
+def tree_entry(item):
+    return TreeEntry(item['path'], item['mode'], item['type'], item['sha'], item.get('size'))
+
+def commit_record(item):
+    c = item['commit']
+    return CommitRecord(item['sha'], c['message'], (c.get('author') or {}).get('name', ""),
+                        c['committer']['date'], tuple(p['sha'] for p in item.get('parents', [])))
+
+class Profiler:
+    # On-demand cProfile: an armed operation is profiled on its next call only (one shot), then saved to disk.
+    # Also keeps the stalls reported by LagMonitor. Results are shared by every thread.
+    def __init__(self):
+        self.armed = set()
+        self.results = [] # {"kind", "title", "report"} in arrival order
+        self.lock = threading.Lock()
+
+    def arm(self, name, on=True):
+        with self.lock:
+            if on:
+                self.armed.add(name)
+            else:
+                self.armed.discard(name)
+
+    @contextlib.contextmanager
+    def section(self, name):
+        prof = self._claim(name)
+        if prof is None:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            prof.disable()
+            self._save(name, prof, time.perf_counter() - t0)
+
+    def _claim(self, name):
+        with self.lock:
+            if name not in self.armed:
+                return None
+            self.armed.discard(name)
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError:
+            # Another profile is running (one profiler at a time since 3.12), try on the next call
+            self.arm(name)
+            return None
+        return prof
+
+    def _save(self, name, prof, elapsed):
+        out = io.StringIO()
+        pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+        stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+        base = os.path.join(PROFILE_DIR, f"{name}-{stamp}")
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            prof.dump_stats(base + ".prof")
+            with open(base + ".txt", 'w', encoding='utf-8') as f:
+                f.write(out.getvalue())
+        except OSError as e:
+            print(f"Profile save error: {e}")
+        self._add("profile", f"{stamp} {name} ({elapsed * 1000:.0f} ms)", f"{base}.prof\n\n{out.getvalue()}")
+
+    def add_stall(self, ms, callback, stack):
+        stamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            with open(os.path.join(PROFILE_DIR, "lag.log"), 'a', encoding='utf-8') as f:
+                f.write(f"{stamp} {ms:.0f} ms in {callback}\n{stack}\n")
+        except OSError as e:
+            print(f"Lag log error: {e}")
+        self._add("stall", f"{stamp[11:]} stall {ms:.0f} ms - {callback}", stack)
+
+    def _add(self, kind, title, report):
+        with self.lock:
+            self.results.append({"kind": kind, "title": title, "report": report})
+
+PROFILER = Profiler()
+
+def profiled(name):
+    # Method decorator: lets PROFILER profile the next call of name when armed
+    def wrap(func):
+        @functools.wraps(func)
+        def inner(*args, **kwargs):
+            with PROFILER.section(name):
+                return func(*args, **kwargs)
+        return inner
+    return wrap
+
+class LagMonitor:
+    # Watchdog for the Tk event loop: the main thread posts a heartbeat with after(), a background thread
+    # notices when it is late and samples the main-thread stack (sys._current_frames) while it is blocked.
+    def __init__(self, root, profiler, threshold_ms=LAG_THRESHOLD_MS):
+        self.root = root
+        self.profiler = profiler
+        self.threshold_ms = threshold_ms
+        self.running = False
+        self.last_beat = time.monotonic()
+
+    def start(self):
+        if self.running: return
+        self.running = True
+        self.last_beat = time.monotonic()
+        self._beat()
+        threading.Thread(target=self._watch, daemon=True).start()
+
+    def stop(self):
+        self.running = False
+
+    def _beat(self):
+        self.last_beat = time.monotonic()
+        if self.running:
+            self.root.after(LAG_HEARTBEAT_MS, self._beat)
+
+    def _watch(self):
+        main_id = threading.main_thread().ident
+        stall = None # {"late": worst delay seen, "samples": Counter of culprits, "stacks": culprit -> stack text}
+        while self.running:
+            time.sleep(LAG_HEARTBEAT_MS / 2000)
+            late_ms = (time.monotonic() - self.last_beat) * 1000 - LAG_HEARTBEAT_MS
+            if late_ms >= self.threshold_ms:
+                frame = sys._current_frames().get(main_id)
+                if frame is None: continue
+                stack = traceback.extract_stack(frame)
+                culprit = self._culprit(stack)
+                if stall is None:
+                    stall = {"late": 0, "samples": collections.Counter(), "stacks": {}}
+                stall["late"] = late_ms
+                stall["samples"][culprit] += 1
+                stall["stacks"].setdefault(culprit, "".join(traceback.format_list(stack)))
+            elif stall:
+                culprit = stall["samples"].most_common(1)[0][0]
+                self.profiler.add_stall(stall["late"], culprit, stall["stacks"][culprit])
+                stall = None
+
+    @staticmethod
+    def _culprit(stack):
+        # Outermost frame of this app below mainloop: the Tk callback that is blocking
+        for fs in stack:
+            if os.path.basename(fs.filename) == os.path.basename(__file__) and fs.name != "<module>":
+                return f"{fs.name} (line {fs.lineno})"
+        last = stack[-1]
+        return f"{last.name} ({os.path.basename(last.filename)}:{last.lineno})"
+
 class GitHubManager:
     def __init__(self):
         self.root = tk.Tk()
@@ -85,11 +1571,42 @@ class GitHubManager:
         self.token = ""
         self.username = ""
         self.current_repo = "" # Format: Owner/Repo
+        self.lfs_url = "" # Optional LFS endpoint override (e.g. a local test server)
+        self.dashboard_repos = [] # Owner/Repo list shown in the Dashboard tab
+        
+        self.etag_cache = {} # url -> (etag, data) for conditional requests
+        self.etag_lock = threading.Lock()
+        self.api_stats = ApiStats() # Measured request cost + rate limit, for dry-run plans
         
         self.current_local_path = os.getcwd()
         self.current_remote_path = "" # Root
         
         self.remote_cache = [] # Cache of current remote folder items
+        self.blob_cache = BlobCache(BLOB_CACHE_DIR, BLOB_CACHE_MAX_BYTES) # File contents by blob SHA
+        self.commit_cache = ObjectCache(COMMIT_CACHE_DIR) # Commit details by SHA
+        self.tree_cache = ObjectCache(TREE_CACHE_DIR) # [name, type, sha, size, mode] rows by tree SHA
+        self.commit_trees = {} # commit SHA -> root tree SHA (immutable too)
+        
+        # Browsed ref: "" is the default branch, otherwise a branch, tag or commit SHA
+        self.current_ref = ""
+        self.ref_branches = set()
+        self.ref_tags = set()
+        self.history = {"key": None, "commits": [], "next": None, "loading": False, "offset": 0, "selected": None}
+        
+        # Remote filename search
+        self.path_index = None
+        self.path_index_key = None # (repo, branch) the index belongs to
+        self.path_index_checked = 0 # time.monotonic() of the last head check
+        self.path_index_busy = False
+        self.search_after_id = None
+        self.pending_remote_select = None # Path to select once its folder is listed
+        self.remote_view_path = None # Remote path currently rendered in tree_remote
+        
+        # Session snapshot data (persisted on exit)
+        self.remote_root_cache = [] # Root listing
+        self.releases_cache = []
+        self.repo_info = {}
+        self.repo_topics = []
         
         # Icons (Unicode fallback)
         self.ICON_FOLDER = "📁"
@@ -116,8 +1633,39 @@ class GitHubManager:
         self.notebook.add(self.tab_repo_info, text=" ✨ Repo Info ")
         self.create_repo_info_ui()
         
+        self.tab_dashboard = ttk.Frame(self.notebook)
+        self.notebook.add(self.tab_dashboard, text=" 📊 Dashboard ")
+        self.create_dashboard_ui()
+        
+        self.tab_history = ttk.Frame(self.notebook)
+        self.notebook.add(self.tab_history, text=" 🕓 History ")
+        self.create_history_ui()
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        
         self.status_var = tk.StringVar(value="Ready.")
-        tk.Label(self.root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W).pack(side=tk.BOTTOM, fill=tk.X)
+        status_bar = tk.Frame(self.root, bd=1, relief=tk.SUNKEN)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        tk.Label(status_bar, textvariable=self.status_var, anchor=tk.W).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Global transfer progress (shown while transfers run)
+        self.transfer_frame = tk.Frame(status_bar)
+        self.transfer_bar = ttk.Progressbar(self.transfer_frame, orient="horizontal", mode="determinate", length=150)
+        self.transfer_bar.pack(side=tk.LEFT, padx=5)
+        self.transfer_label = tk.Label(self.transfer_frame, text="", font=("Consolas", 9))
+        self.transfer_label.pack(side=tk.LEFT)
+        
+        self.lag_monitor = LagMonitor(self.root, PROFILER)
+        
+        # All transfer threads report here, the UI reads it at a capped rate
+        self.progress = TransferProgress()
+        self.progress_seen_seq = 0
+        self.root.after(PROGRESS_UI_INTERVAL_MS, self._progress_tick)
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Show last session immediately, then revalidate in background
+        if self.load_session():
+            self.root.after(0, self.connect)
 
     def create_header(self):
         frame = tk.Frame(self.root, bg="#333", pady=10)
@@ -148,6 +1696,7 @@ class GitHubManager:
         tk.Button(frame, text="Logout", bg="#555", fg="white", font=("Segoe UI", 8), command=self.logout).pack(side=tk.RIGHT, padx=5)
         
         tk.Button(frame, text="?", width=3, bg="#444", fg="white", font=("Segoe UI", 8, "bold"), command=self.show_about).pack(side=tk.RIGHT, padx=2)
+        tk.Button(frame, text="⏱", width=3, bg="#444", fg="white", font=("Segoe UI", 8), command=self.show_profiler).pack(side=tk.RIGHT, padx=2)
         tk.Button(frame, text="MyGitHub", bg="#444", fg="white", font=("Segoe UI", 8), command=self.open_my_github).pack(side=tk.RIGHT, padx=2)
 
     def create_file_manager_ui(self):
@@ -189,14 +1738,38 @@ class GitHubManager:
         # --- RIGHT: REMOTE ---
         right_frame = ttk.LabelFrame(self.paned, text=" GitHub Remote ")
         self.paned.add(right_frame)
+        self.remote_frame = right_frame
         
         # Nav Bar Remote
         nav_r = tk.Frame(right_frame)
         nav_r.pack(fill=tk.X, padx=2, pady=2)
         tk.Button(nav_r, text="⬆", command=self.go_up_remote, width=3).pack(side=tk.LEFT)
+        # Branch / tag / commit SHA (typed SHAs are accepted with Enter)
+        self.ref_combo = ttk.Combobox(nav_r, width=16)
+        self.ref_combo.pack(side=tk.LEFT, padx=2)
+        self.ref_combo.bind("<<ComboboxSelected>>", self.on_ref_selected)
+        self.ref_combo.bind("<Return>", self.on_ref_selected)
         self.path_label_remote = tk.Entry(nav_r, fg="blue") # Read-only-ish entry for copy paste
         self.path_label_remote.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
         tk.Button(nav_r, text="⟳", command=self.refresh_remote, width=3).pack(side=tk.RIGHT)
+        
+        # Search Bar Remote (whole repository, fuzzy)
+        search_r = tk.Frame(right_frame)
+        search_r.pack(fill=tk.X, padx=2, pady=(0, 2))
+        tk.Label(search_r, text="🔍").pack(side=tk.LEFT)
+        self.search_entry = tk.Entry(search_r)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
+        self.search_entry.bind("<KeyRelease>", self.on_search_key)
+        self.search_entry.bind("<Return>", lambda e: self.jump_to_search_result())
+        self.search_entry.bind("<Down>", lambda e: self.search_results.focus_set() or self.search_results.selection_set(0))
+        self.search_entry.bind("<Escape>", lambda e: self.clear_search())
+        self.lbl_search = tk.Label(search_r, text="", fg="#888")
+        self.lbl_search.pack(side=tk.RIGHT)
+        
+        self.search_results = tk.Listbox(right_frame, height=8, font=("Consolas", 9))
+        self.search_results.bind("<Double-1>", lambda e: self.jump_to_search_result())
+        self.search_results.bind("<Return>", lambda e: self.jump_to_search_result())
+        self.search_results.bind("<Escape>", lambda e: self.clear_search())
 
         # Tree Remote
         self.tree_remote = ttk.Treeview(right_frame, columns=("type", "size", "date"), show="tree headings")
@@ -230,6 +1803,15 @@ class GitHubManager:
         tk.Button(bot_frame, text="🗑 DELETE Remote File", bg="#ff5555", fg="white",
                   command=self.delete_remote).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
 
+        tk.Button(bot_frame, text="👁 PREVIEW Remote File", bg="#607d8b", fg="white",
+                  command=self.preview_remote).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        tk.Button(bot_frame, text="✏ MOVE / RENAME", bg="#ff9800", fg="white",
+                  command=self.move_remote).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        tk.Button(bot_frame, text="⧉ COPY Remote", bg="#9c27b0", fg="white",
+                  command=lambda: self.move_remote(copy=True)).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
         tk.Button(bot_frame, text="⚡ RESET HISTORY (Squash)", bg="#000000", fg="white",
                   command=self.reset_history).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
 
@@ -246,6 +1828,7 @@ class GitHubManager:
         btns.pack(fill=tk.X, padx=10)
         ttk.Button(btns, text="Refresh", command=self.refresh_releases).pack(side=tk.LEFT)
         ttk.Button(btns, text="Delete Selected", command=self.delete_release).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btns, text="⬇ Download Asset", command=self.download_asset).pack(side=tk.LEFT)
         
         # Creator
         grp = ttk.LabelFrame(self.tab_releases, text=" Publish Release ")
@@ -305,6 +1888,118 @@ class GitHubManager:
         self.lbl_repo_stats = tk.Label(info_grp, text="Stars: 0 | Forks: 0 | Issues: 0", font=("Segoe UI", 9, "italic"))
         self.lbl_repo_stats.pack(anchor=tk.W, padx=10, pady=5)
 
+    def create_dashboard_ui(self):
+        top = tk.Frame(self.tab_dashboard)
+        top.pack(fill=tk.X, padx=10, pady=10)
+        
+        tk.Label(top, text="Repositories (one Owner/Repo per line):").pack(anchor=tk.W)
+        self.dashboard_text = tk.Text(top, height=5, font=("Consolas", 9))
+        self.dashboard_text.pack(fill=tk.X, pady=5)
+        self.dashboard_text.insert("1.0", "\n".join(self.dashboard_repos))
+        
+        btns = tk.Frame(top)
+        btns.pack(fill=tk.X)
+        ttk.Button(btns, text="⟳ Refresh All", command=self.refresh_dashboard).pack(side=tk.LEFT)
+        ttk.Button(btns, text="+ Add Topics", command=lambda: self.bulk_update_topics("add")).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btns, text="- Remove Topics", command=lambda: self.bulk_update_topics("remove")).pack(side=tk.LEFT)
+        ttk.Button(btns, text="Set Topics", command=lambda: self.bulk_update_topics("set")).pack(side=tk.LEFT, padx=5)
+        tk.Label(btns, text="Bulk actions apply to the selected rows. Double-click opens a repo.", fg="#888").pack(side=tk.LEFT, padx=10)
+        
+        cols = ("stars", "forks", "issues", "release", "topics", "status")
+        self.tree_dashboard = ttk.Treeview(self.tab_dashboard, columns=cols, show="tree headings", selectmode="extended")
+        self.tree_dashboard.heading("#0", text="Repository")
+        self.tree_dashboard.heading("stars", text="Stars")
+        self.tree_dashboard.heading("forks", text="Forks")
+        self.tree_dashboard.heading("issues", text="Issues")
+        self.tree_dashboard.heading("release", text="Latest Release")
+        self.tree_dashboard.heading("topics", text="Topics")
+        self.tree_dashboard.heading("status", text="Status")
+        self.tree_dashboard.column("#0", width=220)
+        for c in ("stars", "forks", "issues"):
+            self.tree_dashboard.column(c, width=60, anchor="e")
+        self.tree_dashboard.column("release", width=110)
+        self.tree_dashboard.column("topics", width=300)
+        self.tree_dashboard.column("status", width=150)
+        self.tree_dashboard.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        
+        self.tree_dashboard.bind("<Double-1>", self.on_dashboard_double_click)
+
+    # --- PROGRESS ---
+    def _progress_tick(self):
+        # Single UI update path for every transfer, runs every PROGRESS_UI_INTERVAL_MS
+        try:
+            snap = self.progress.sample()
+            if snap["message_seq"] != self.progress_seen_seq:
+                self.progress_seen_seq = snap["message_seq"]
+                self.status_var.set(snap["message"])
+            
+            if snap["active"]:
+                if snap["bytes_total"]:
+                    percent = min(100.0, snap["bytes_done"] / snap["bytes_total"] * 100)
+                elif snap["items_total"]:
+                    percent = snap["items_done"] / snap["items_total"] * 100
+                else:
+                    percent = 0
+                speed_mb = snap["speed"] / (1024 * 1024)
+                eta_str = str(datetime.timedelta(seconds=int(snap["eta"])))
+                text = f"{percent:.1f}% | {speed_mb:.2f} MB/s | ETA: {eta_str}"
+                if snap["items_total"]:
+                    text += f" | {snap['items_done']}/{snap['items_total']} items"
+                
+                self.transfer_bar.configure(value=percent)
+                self.transfer_label.configure(text=text)
+                self.progress_bar.configure(value=percent)
+                self.progress_label.configure(text=text)
+                if not self.transfer_frame.winfo_ismapped():
+                    self.transfer_frame.pack(side=tk.RIGHT)
+            elif self.transfer_frame.winfo_ismapped():
+                self.transfer_frame.pack_forget()
+        except Exception as e:
+            print(f"Progress update error: {e}")
+        self.root.after(PROGRESS_UI_INTERVAL_MS, self._progress_tick)
+
+    def create_history_ui(self):
+        top = tk.Frame(self.tab_history)
+        top.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(top, text="⟳ Refresh", command=self.refresh_history).pack(side=tk.LEFT)
+        self.lbl_history = tk.Label(top, text="", fg="#666")
+        self.lbl_history.pack(side=tk.LEFT, padx=10)
+        
+        # Only HISTORY_VISIBLE_ROWS rows exist, they are refilled from self.history while scrolling
+        list_frame = tk.Frame(self.tab_history)
+        list_frame.pack(fill=tk.X, padx=10)
+        self.tree_history = ttk.Treeview(list_frame, columns=("sha", "date", "author", "message"), show="headings",
+                                         height=HISTORY_VISIBLE_ROWS, selectmode="browse")
+        self.tree_history.heading("sha", text="Commit")
+        self.tree_history.heading("date", text="Date")
+        self.tree_history.heading("author", text="Author")
+        self.tree_history.heading("message", text="Message")
+        self.tree_history.column("sha", width=80)
+        self.tree_history.column("date", width=120)
+        self.tree_history.column("author", width=140)
+        self.tree_history.column("message", width=600)
+        
+        self.history_scroll = ttk.Scrollbar(list_frame, orient="vertical", command=self._history_yview)
+        self.tree_history.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.history_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.history_rows = [self.tree_history.insert("", "end", values=("", "", "", "")) for _ in range(HISTORY_VISIBLE_ROWS)]
+        
+        self.tree_history.bind("<<TreeviewSelect>>", self._on_history_select)
+        self.tree_history.bind("<MouseWheel>", lambda e: self._history_scroll_by(-1 if e.delta > 0 else 1) or "break")
+        self.tree_history.bind("<Button-4>", lambda e: self._history_scroll_by(-1) or "break")
+        self.tree_history.bind("<Button-5>", lambda e: self._history_scroll_by(1) or "break")
+        self.tree_history.bind("<Up>", lambda e: self._history_move_selection(-1) or "break")
+        self.tree_history.bind("<Down>", lambda e: self._history_move_selection(1) or "break")
+        
+        self.history_detail = tk.Text(self.tab_history, height=12, font=("Consolas", 9), wrap=tk.NONE)
+        self.history_detail.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    def on_tab_changed(self, event):
+        # History is loaded lazily, the first time the tab is shown for a repo/branch
+        if self.notebook.select() == str(self.tab_history) and self.token and self.current_repo:
+            if self.history["key"] != (self.current_repo, self._ref()):
+                self.refresh_history()
+
     # --- CORE LOGIC ---
     def load_config(self):
         if os.path.exists(CONFIG_FILE):
@@ -313,13 +2008,75 @@ class GitHubManager:
                     data = json.load(f)
                     self.token = data.get("token", "")
                     self.current_repo = data.get("repo", "")
+                    self.lfs_url = data.get("lfs_url", "")
+                    self.dashboard_repos = data.get("dashboard_repos", [])
             except: pass
             
     def save_config(self):
         self.token = self.token_entry.get().strip()
         self.current_repo = self.repo_entry.get().strip()
         with open(CONFIG_FILE, 'w') as f:
-            json.dump({"token": self.token, "repo": self.current_repo}, f)
+            json.dump({"token": self.token, "repo": self.current_repo, "lfs_url": self.lfs_url,
+                       "dashboard_repos": self.dashboard_repos}, f)
+
+    def load_session(self):
+        # Render the last session snapshot (marked as cached). Returns True if something was shown.
+        if not self.token or not self.current_repo or not os.path.exists(SESSION_FILE):
+            return False
+        try:
+            with open(SESSION_FILE, 'r', encoding='utf-8') as f:
+                snap = json.load(f)
+        except Exception as e:
+            print(f"Error loading session: {e}")
+            return False
+        if snap.get("repo") != self.current_repo:
+            return False
+        
+        self.username = snap.get("user", "")
+        self.lbl_user_status.config(text=f"Cached: {self.username}", fg="#ffaa00")
+        self.remote_root_cache = snap.get("root", [])
+        self.releases_cache = snap.get("releases", [])
+        self.repo_info = snap.get("repo_info", {})
+        self.repo_topics = snap.get("topics", [])
+        
+        self.current_remote_path = ""
+        self.path_label_remote.insert(0, "(root)")
+        self._populate_remote(self.remote_root_cache, fetch_dates=False)
+        self.remote_frame.config(text=" GitHub Remote (cached) ")
+        self._populate_releases(self.releases_cache)
+        if self.repo_info:
+            self._apply_repo_data(self.repo_info, self.repo_topics)
+        self.refresh_local()
+        self.status_var.set(f"Showing cached session from {snap.get('saved_at', '?')} - revalidating...")
+        return True
+
+    def save_session(self):
+        if not self.current_repo or not self.username:
+            return
+        keep = ("name", "path", "type", "sha", "size")
+        snap = {
+            "repo": self.current_repo,
+            "user": self.username,
+            "saved_at": datetime.datetime.now().strftime('%Y-%m-%d %H:%M'),
+            "root": [{k: x.get(k) for k in keep} for x in self.remote_root_cache],
+            "releases": [{
+                "id": r['id'], "tag_name": r['tag_name'], "name": r['name'], "published_at": r['published_at'],
+                "assets": r['assets']
+            } for r in self.releases_cache],
+            "repo_info": self.repo_info,
+            "topics": self.repo_topics
+        }
+        try:
+            tmp = SESSION_FILE + ".tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(snap, f)
+            os.replace(tmp, SESSION_FILE)
+        except Exception as e:
+            print(f"Error saving session: {e}")
+
+    def on_close(self):
+        self.save_session()
+        self.root.destroy()
 
     def logout(self):
         if messagebox.askyesno("Confirm", "Logout and clear config?"):
@@ -328,6 +2085,7 @@ class GitHubManager:
             self.token_entry.delete(0, tk.END)
             self.repo_entry.delete(0, tk.END)
             if os.path.exists(CONFIG_FILE): os.remove(CONFIG_FILE)
+            if os.path.exists(SESSION_FILE): os.remove(SESSION_FILE)
             self.lbl_user_status.config(text="Offline")
 
     def create_new_repo(self):
@@ -348,6 +2106,11 @@ class GitHubManager:
         # Ask if private
         is_private = messagebox.askyesno("Visibility", "Make repository PRIVATE?\n\n(No = Public)")
         
+        # Optional initial content, published as the only commit
+        source = None
+        if messagebox.askyesno("Initial Content", "Publish a local folder as the initial commit?\n\n(.gitignore and LFS rules of the folder apply)"):
+            source = filedialog.askdirectory(title="Source folder", initialdir=self.current_local_path) or None
+        
         def _create():
             self.status_var.set(f"Creating repository '{repo_name}'...")
             try:
@@ -367,9 +2130,18 @@ class GitHubManager:
                 with urllib.request.urlopen(req) as response:
                     result = json.loads(response.read().decode())
                     full_name = result['full_name']  # e.g. "CordaAvlao/NewRepo"
+                
+                seeded = ""
+                if source:
+                    try:
+                        count = self._seed_repo(full_name, result.get('default_branch') or "main", source)
+                        seeded = f"\n\n{count} files published from {source} in a single commit."
+                    except Exception as e:
+                        self.progress.end(f"Seeding failed: {e}")
+                        seeded = f"\n\nInitial content could not be published: {e}"
                     
                 self.status_var.set(f"Repository '{repo_name}' created!")
-                messagebox.showinfo("Success", f"Repository created!\n\n{full_name}\n\nIt will now be set as current repo.")
+                messagebox.showinfo("Success", f"Repository created!\n\n{full_name}{seeded}\n\nIt will now be set as current repo.")
                 
                 # Auto-fill the repo entry and connect
                 self.root.after(0, lambda: self._set_and_connect(full_name))
@@ -385,6 +2157,76 @@ class GitHubManager:
                 
         threading.Thread(target=_create, daemon=True).start()
 
+    def _seed_repo(self, repo, branch, folder):
+        # Publishes folder as the only commit of a fresh repo: blobs are created concurrently,
+        # then one tree (no base_tree), one parentless commit, and the branch is forced onto it
+        # (this drops the auto_init README commit). Returns the number of files.
+        base = f"https://api.github.com/repos/{repo}/git"
+        self.progress.begin(message=f"Scanning {folder}...")
+        
+        # 1. Walk + hash with the folder's gitignore. The folder is usually a working copy:
+        # its .git (objects, hooks, config with remotes/credentials) is never published.
+        checker = GitIgnoreChecker(folder)
+        checker.patterns.append(".git")
+        scanner = TreeScanner(folder, checker, folder)
+        files = list(scanner)
+        if not files:
+            self.progress.end("Nothing to publish (empty folder).")
+            return 0
+        lfs = GitAttributesChecker(folder)
+        
+        # 2. LFS files: push objects, the tree gets their pointers instead
+        lfs_files = [p for p, _, _ in files if lfs.is_lfs(os.path.relpath(p, folder))]
+        pointers = {} # local path -> pointer bytes
+        if lfs_files:
+            self.progress.set_message(f"Pushing {len(lfs_files)} LFS objects...")
+            objs = []
+            for p in lfs_files:
+                oid, size = lfs_oid(p)
+                pointers[p] = make_lfs_pointer(oid, size)
+                objs.append((p, oid, size))
+            self.progress.add_total(sum(size for _, _, size in objs))
+            self._lfs_client(repo).upload(objs)
+        
+        # 3. One blob per distinct content, in parallel
+        tree = []
+        unique = {} # blob sha -> local path
+        for local_path, size, blob_sha in files:
+            if local_path in pointers:
+                blob_sha = git_blob_sha(pointers[local_path])
+            elif blob_sha is None:
+                blob_sha = hash_file_blob(local_path) # Scan could not hash it: raises if still unreadable
+            unique.setdefault(blob_sha, local_path)
+            mode = "100755" if os.name != "nt" and os.access(local_path, os.X_OK) else "100644"
+            rel = os.path.relpath(local_path, folder).replace("\\", "/")
+            tree.append({"path": rel, "mode": mode, "type": "blob", "sha": blob_sha})
+        self.progress.add_total(sum(os.path.getsize(p) for p in unique.values() if p not in pointers), len(unique))
+        self.progress.set_message(f"Uploading {len(unique)} blobs...")
+        
+        def _blob(sha, path):
+            if path in pointers:
+                content = pointers[path]
+            else:
+                with open(path, 'rb') as f: content = f.read()
+            res = self.api_request(f"{base}/blobs", "POST", {"content": base64.b64encode(content).decode(), "encoding": "base64"})
+            if res['sha'] != sha:
+                raise Exception(f"Blob SHA mismatch for {path}")
+            if path not in pointers:
+                self.progress.add_bytes(len(content))
+            self.progress.item_done()
+        
+        with ThreadPoolExecutor(max_workers=SEED_BLOB_WORKERS) as pool:
+            for fut in as_completed([pool.submit(_blob, sha, path) for sha, path in unique.items()]):
+                fut.result()
+        
+        # 4. Tree, orphan commit, forced ref
+        self.progress.set_message("Creating initial commit...")
+        tree_sha = self.api_request(f"{base}/trees", "POST", {"tree": tree})['sha']
+        commit = self.api_request(f"{base}/commits", "POST", {"message": "Initial commit", "tree": tree_sha, "parents": []})
+        self.api_request(f"{base}/refs/heads/{branch}", "PATCH", {"sha": commit['sha'], "force": True})
+        self.progress.end(f"Published {len(files)} files ({len(unique)} blobs). Ignored: {scanner.skipped}")
+        return len(files)
+
     def _set_and_connect(self, full_name):
         self.repo_entry.delete(0, tk.END)
         self.repo_entry.insert(0, full_name)
@@ -395,45 +2237,162 @@ class GitHubManager:
         if not self.token or not self.current_repo:
             messagebox.showerror("Error", "Token and Repo required!")
             return
+        # Back to the default branch (the repo may have changed)
+        self.current_ref = ""
+        self.ref_branches = set()
+        self.ref_combo.set("")
         threading.Thread(target=self._connect_thread, daemon=True).start()
 
     def _connect_thread(self):
         self.status_var.set("Connecting...")
+        repo_url = f"https://api.github.com/repos/{self.current_repo}"
+        remote_path = self.current_remote_path
         try:
-            # 1. Get User
-            u = self.api_request("https://api.github.com/user")
-            self.username = u['login']
-            
-            # 2. Check Repo existence
-            self.api_request(f"https://api.github.com/repos/{self.current_repo}")
+            # All connect-time requests run in parallel
+            with ThreadPoolExecutor(max_workers=CONNECT_WORKERS) as pool:
+                f_user = pool.submit(self.api_request, "https://api.github.com/user")
+                f_repo = pool.submit(self.api_request, repo_url)
+                f_topics = pool.submit(self.api_request, f"{repo_url}/topics")
+                f_releases = pool.submit(self.api_request, f"{repo_url}/releases")
+                f_remote = pool.submit(self._list_remote, remote_path)
+                f_refs = pool.submit(self._list_refs)
+                
+                # 1. User and Repo are required
+                self.username = f_user.result()['login']
+                repo = f_repo.result()
             
             self.root.after(0, lambda: self.lbl_user_status.config(text=f"Connected: {self.username}", fg="#00ff00"))
             self.status_var.set(f"Connected to {self.current_repo}")
-            
-            # Init Views
             self.root.after(0, self.refresh_local)
-            self.root.after(0, self.refresh_remote)
-            self.root.after(0, self.refresh_releases)
-            self.root.after(0, self.fetch_repo_data)
+            
+            # 2. Patch views in place as optional results come in
+            try:
+                self._set_remote_listing(remote_path, f_remote.result())
+            except Exception as e:
+                self.status_var.set(f"Remote Error: {e}")
+            try:
+                names = f_topics.result().get("names", [])
+            except Exception as e:
+                print(f"Fetch Topics Error: {e}")
+                names = self.repo_topics
+            self.root.after(0, lambda: self._apply_repo_data(repo, names))
+            try:
+                branches, tags = f_refs.result()
+                self.root.after(0, lambda: self._apply_refs(branches, tags))
+            except Exception as e:
+                print(f"Fetch Refs Error: {e}")
+            # After the refs: a job is only resumed on a branch that still exists
+            self.root.after(0, self.offer_resume_jobs)
+            try:
+                releases = f_releases.result()
+                self.releases_cache = releases
+                self.root.after(0, lambda: self._populate_releases(releases))
+            except Exception as e:
+                print(f"Fetch Releases Error: {e}")
             
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Conn Error", str(e)))
             self.status_var.set("Connection Failed.")
 
-    def api_request(self, url, method="GET", data=None):
+    def _api_open(self, url, method="GET", data=None, headers=None):
         req = urllib.request.Request(url, method=method)
         req.add_header("Authorization", f"Bearer {self.token}")
         # Add Mercury preview for Topics API if needed, standard V3 for others
         req.add_header("Accept", "application/vnd.github.mercury-preview+json, application/vnd.github.v3+json")
         req.add_header("Content-Type", "application/json")
+        req.add_header("Accept-Encoding", "gzip")
+        for k, v in (headers or {}).items():
+            req.add_header(k, v)
         
         body = json.dumps(data).encode() if data else None
-        
-        with urllib.request.urlopen(req, data=body) as r:
+        t0 = time.monotonic()
+        try:
+            r = urllib.request.urlopen(req, data=body)
+        except urllib.error.HTTPError as e:
+            self.api_stats.record(len(body or b""), time.monotonic() - t0, e.headers)
+            raise
+        self.api_stats.record(len(body or b""), time.monotonic() - t0, r.headers)
+        return r
+
+    @profiled("api_request")
+    def api_request(self, url, method="GET", data=None):
+        with self._api_open(url, method, data) as r:
             if method == "DELETE": return None
-            return json.loads(r.read().decode())
+            return JSONStreamReader(open_response_stream(r)).read_value()
+
+    def api_request_cached(self, url):
+        # Conditional GET: a 304 reuses the previous body and does not count against the rate limit
+        with self.etag_lock:
+            cached = self.etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        try:
+            with self._api_open(url, headers=headers) as r:
+                data = JSONStreamReader(open_response_stream(r)).read_value()
+                etag = r.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                return cached[1]
+            raise
+        if etag:
+            with self.etag_lock:
+                self.etag_cache[url] = (etag, data)
+        return data
+
+    def api_stream(self, url, key=None, record=None):
+        # Generator over a large JSON array response (optionally under key), mapped through record
+        with self._api_open(url) as r:
+            reader = JSONStreamReader(open_response_stream(r))
+            for item in reader.iter_array(key):
+                yield record(item) if record else item
+
+    def api_commit_page(self, url):
+        # One page of commits (CommitRecord) and the cursor of the next page, or None at the end
+        with self._api_open(url) as r:
+            next_url = parse_next_link(r.headers.get("Link"))
+            reader = JSONStreamReader(open_response_stream(r))
+            records = [commit_record(item) for item in reader.iter_array()]
+        return records, next_url
+
+    def api_ref_sha(self, ref):
+        # Commit SHA a branch, tag or (short) SHA points to. Bare SHA media type + ETag:
+        # an unchanged ref costs a 304 that does not count against the rate limit.
+        url = f"https://api.github.com/repos/{self.current_repo}/commits/{urllib.parse.quote(ref)}"
+        with self.etag_lock:
+            cached = self.etag_cache.get(url)
+        headers = {"Accept": "application/vnd.github.sha"}
+        if cached: headers["If-None-Match"] = cached[0]
+        try:
+            with self._api_open(url, headers=headers) as r:
+                sha = open_response_stream(r).read().decode().strip()
+                etag = r.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                return cached[1]
+            raise
+        if etag:
+            with self.etag_lock:
+                self.etag_cache[url] = (etag, sha)
+        return sha
+
+    def api_tree(self, tree_sha, recursive=True):
+        # Returns (list of TreeEntry, truncated)
+        url = f"https://api.github.com/repos/{self.current_repo}/git/trees/{tree_sha}"
+        if recursive: url += "?recursive=1"
+        with self._api_open(url) as r:
+            reader = JSONStreamReader(open_response_stream(r))
+            entries = [tree_entry(item) for item in reader.iter_array("tree")]
+        return entries, bool(reader.fields.get("truncated"))
+
+    def api_commits(self, ref=None, path=None, per_page=100, page=1):
+        # Returns one page of history as a list of CommitRecord
+        params = {"per_page": per_page, "page": page}
+        if ref: params["sha"] = ref
+        if path: params["path"] = path
+        url = f"https://api.github.com/repos/{self.current_repo}/commits?{urllib.parse.urlencode(params)}"
+        return list(self.api_stream(url, record=commit_record))
 
     # --- LOCAL FILE LOGIC ---
+    @profiled("refresh_local")
     def refresh_local(self):
         self.path_entry_local.delete(0, tk.END)
         self.path_entry_local.insert(0, self.current_local_path)
@@ -487,50 +2446,114 @@ class GitHubManager:
     def _remote_list_thread(self):
         self.status_var.set("Fetching remote...")
         try:
-            # Clean path for display
-            display_path = self.current_remote_path if self.current_remote_path else "(root)"
-            self.root.after(0, lambda: self.path_label_remote.delete(0, tk.END) or self.path_label_remote.insert(0, display_path))
-            
-            url = f"https://api.github.com/repos/{self.current_repo}/contents/{self.current_remote_path}"
-            data = self.api_request(url)
-            
-            if not isinstance(data, list): data = [data] # Single file case (shouldn't happen with nav logic)
-            
-            # Sort folders first
-            data.sort(key=lambda x: (x['type'] != 'dir', x['name'].lower()))
-            
-            self.root.after(0, lambda: self._populate_remote(data))
-            self.status_var.set("Remote OK.")
+            path = self.current_remote_path
+            ref = self._ref()
+            self._set_remote_listing(path, self._list_remote(path, ref), ref)
         except Exception as e:
             self.status_var.set(f"Remote Error: {e}")
 
-    def _populate_remote(self, items):
-        self.tree_remote.delete(*self.tree_remote.get_children())
+    @profiled("list_remote")
+    def _list_remote(self, path, ref=None):
+        # Folder listing at a ref, walked down from the root tree.
+        # Only the ref resolution hits the network once trees are cached (conditional request).
+        ref = ref or self._ref()
+        _, tree_sha = self._get_head(ref)
+        for part in [p for p in path.split('/') if p]:
+            row = next((r for r in self._tree_rows(tree_sha) if r[0] == part and r[1] == "tree"), None)
+            if row is None:
+                raise Exception(f"'{path}' does not exist at {ref}")
+            tree_sha = row[2]
+        
+        kinds = {"tree": "dir", "blob": "file", "commit": "submodule"}
+        data = [{
+            "name": name,
+            "path": f"{path}/{name}" if path else name,
+            "type": kinds.get(t, t),
+            "sha": sha,
+            "size": size or 0,
+            "mode": mode
+        } for name, t, sha, size, mode in self._tree_rows(tree_sha)]
+        
+        # Sort folders first
+        data.sort(key=lambda x: (x['type'] != 'dir', x['name'].lower()))
+        return data
+
+    def _tree_rows(self, tree_sha):
+        # One level of a tree. Trees never change for a given SHA: cached forever, never revalidated,
+        # so refs sharing subtrees only fetch what differs.
+        rows = self.tree_cache.get(tree_sha)
+        if rows is None:
+            entries, _ = self.api_tree(tree_sha, recursive=False)
+            rows = [[e.path, e.type, e.sha, e.size, e.mode] for e in entries]
+            self.tree_cache.put(tree_sha, rows)
+        return rows
+
+    def _set_remote_listing(self, path, data, ref=None):
+        # Called from worker threads once a listing for path is known
+        if path != self.current_remote_path: return # User navigated away meanwhile
+        if ref and ref != self._ref(): return # Ref switched meanwhile
+        if not path and not self.current_ref:
+            self.remote_root_cache = data
+        
+        # Clean path for display
+        display_path = path if path else "(root)"
+        self.root.after(0, lambda: self.path_label_remote.delete(0, tk.END) or self.path_label_remote.insert(0, display_path))
+        self.root.after(0, lambda: self._populate_remote(data))
+        self.status_var.set("Remote OK.")
+
+    @profiled("populate_remote")
+    def _populate_remote(self, items, fetch_dates=True):
+        # Rows of the same folder are patched in place (keeps selection/scroll), otherwise rebuilt
+        existing = {}
+        if self.remote_view_path == self.current_remote_path:
+            for iid in self.tree_remote.get_children():
+                existing[self.tree_remote.item(iid)['tags'][1]] = iid
+        else:
+            self.tree_remote.delete(*self.tree_remote.get_children())
+        self.remote_view_path = self.current_remote_path
         self.remote_cache = items
+        self.remote_frame.config(text=self._remote_title())
         
         # Store iids to update them later
         self.remote_item_map = {} # path -> iid
         
-        for item in items:
+        for index, item in enumerate(items):
             is_dir = (item['type'] == 'dir')
             name_disp = f"📁 {item['name']}" if is_dir else f"📄 {item['name']}"
             size = "" if is_dir else f"{item['size']/1024:.1f} KB"
+            tags = (item['type'], item['path'], item['name'])
             
-            iid = self.tree_remote.insert("", "end", text=name_disp, values=(item['type'], size, "..."), tags=(item['type'], item['path'], item['name']))
+            iid = existing.pop(item['path'], None)
+            if iid:
+                date = self.tree_remote.set(iid, "date")
+                self.tree_remote.item(iid, text=name_disp, values=(item['type'], size, date), tags=tags)
+                self.tree_remote.move(iid, "", index)
+            else:
+                iid = self.tree_remote.insert("", index, text=name_disp, values=(item['type'], size, "..."), tags=tags)
             self.remote_item_map[item['path']] = iid
+        
+        if existing:
+            self.tree_remote.delete(*existing.values())
+        
+        # Coming from a search result: highlight it
+        target = self.pending_remote_select
+        if target and target in self.remote_item_map:
+            self.pending_remote_select = None
+            self.tree_remote.selection_set(self.remote_item_map[target])
+            self.tree_remote.see(self.remote_item_map[target])
             
         # Start background date fetch
-        threading.Thread(target=self._fetch_remote_dates, args=(items,), daemon=True).start()
+        if fetch_dates:
+            threading.Thread(target=self._fetch_remote_dates, args=(items,), daemon=True).start()
 
     def _fetch_remote_dates(self, items):
         try:
             for item in items:
                 # Get last commit for this file/folder
-                url = f"https://api.github.com/repos/{self.current_repo}/commits?path={item['path']}&per_page=1"
                 try:
-                    res = self.api_request(url)
+                    res = self.api_commits(ref=self._ref(), path=item['path'], per_page=1)
                     if res and len(res) > 0:
-                        date_str = res[0]['commit']['committer']['date']
+                        date_str = res[0].date
                         # Format date: 2025-12-14T... -> 2025-12-14 10:00
                         dt = datetime.datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
                         formatted = dt.strftime("%Y-%m-%d %H:%M")
@@ -553,6 +2576,181 @@ class GitHubManager:
                 self.tree_remote.set(iid, col, val)
         except: pass
 
+    # --- REMOTE SEARCH ---
+    def on_search_key(self, event):
+        if event.keysym in ("Return", "Escape", "Down", "Up"): return
+        if self.search_after_id:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.run_search)
+
+    @profiled("run_search")
+    def run_search(self):
+        self.search_after_id = None
+        query = self.search_entry.get().strip()
+        if not query:
+            self.clear_search()
+            return
+        if not self.token or not self.current_repo: return
+        
+        self._ensure_path_index()
+        if self.path_index is None or self.path_index_key != (self.current_repo, self._ref()):
+            self.lbl_search.config(text="Indexing...")
+            return
+        
+        t0 = time.perf_counter()
+        results = self.path_index.search(query)
+        ms = (time.perf_counter() - t0) * 1000
+        self.lbl_search.config(text=f"{len(results)} / {len(self.path_index)} ({ms:.0f} ms)")
+        
+        self.search_results.delete(0, tk.END)
+        for path in results:
+            self.search_results.insert(tk.END, path)
+        if not self.search_results.winfo_ismapped():
+            self.search_results.pack(side=tk.TOP, fill=tk.X, padx=2, before=self.tree_remote)
+
+    def clear_search(self):
+        self.search_entry.delete(0, tk.END)
+        self.search_results.delete(0, tk.END)
+        self.search_results.pack_forget()
+        self.lbl_search.config(text="")
+
+    def jump_to_search_result(self):
+        sel = self.search_results.curselection()
+        if not sel:
+            if self.search_results.size() == 0: return
+            sel = (0,)
+        path = self.search_results.get(sel[0])
+        self.clear_search()
+        self.pending_remote_select = path
+        self.current_remote_path = path.rsplit('/', 1)[0] if '/' in path else ""
+        self.refresh_remote()
+
+    def _ensure_path_index(self):
+        # Builds the index on first use, then checks now and then if the branch head moved
+        key = (self.current_repo, self._ref())
+        if self.path_index_busy: return
+        if self.path_index_key == key and time.monotonic() - self.path_index_checked < SEARCH_HEAD_CHECK_SECONDS:
+            return
+        self.path_index_busy = True
+        self.path_index_checked = time.monotonic()
+        threading.Thread(target=self._path_index_thread, args=(key,), daemon=True).start()
+
+    def _path_index_thread(self, key):
+        repo, ref = key
+        try:
+            commit_sha, tree_sha = self._get_head(ref)
+            index = self.path_index if self.path_index_key == key else None
+            
+            if index is None:
+                # 1. First build: full recursive tree
+                index = PathIndex()
+                self._fill_path_index(index, tree_sha)
+            elif index.tree_sha != tree_sha:
+                # 2. Head moved: apply the diff only, on a copy (run_search reads the live index
+                # on the Tk thread), swapped in by _done
+                index = index.copy()
+                if not self._patch_path_index(index, commit_sha):
+                    self._resync_path_index(index, tree_sha)
+            index.tree_sha = tree_sha
+            index.commit_sha = commit_sha
+            
+            def _done():
+                self.path_index = index
+                self.path_index_key = key
+                self.path_index_busy = False
+                if self.search_entry.get().strip():
+                    self.run_search()
+            self.root.after(0, _done)
+        except Exception as e:
+            print(f"Path index error: {e}")
+            self.root.after(0, lambda: [setattr(self, "path_index_busy", False), self.lbl_search.config(text="Index error")])
+
+    def _fill_path_index(self, index, tree_sha):
+        entries, truncated = self.api_tree(tree_sha)
+        if truncated:
+            print("Tree truncated by the API, search results may be incomplete")
+        for e in entries:
+            if e.type == "blob":
+                index.add(e.path)
+
+    def _patch_path_index(self, index, commit_sha):
+        # Uses the compare API, returns False if the diff is too large to be listed
+        res = self.api_request(f"https://api.github.com/repos/{self.current_repo}/compare/{index.commit_sha}...{commit_sha}")
+        files = res.get("files", [])
+        if res.get("status") not in ("ahead", "identical") or len(files) >= SEARCH_COMPARE_MAX_FILES:
+            return False
+        for f in files:
+            if f['status'] == "removed":
+                index.remove(f['filename'])
+            elif f['status'] == "renamed":
+                index.remove(f.get('previous_filename', ""))
+                index.add(f['filename'])
+            else:
+                index.add(f['filename'])
+        return True
+
+    def _resync_path_index(self, index, tree_sha):
+        # Large or non-linear change: diff the full path sets, the postings are still updated in place
+        entries, _ = self.api_tree(tree_sha)
+        current = {e.path for e in entries if e.type == "blob"}
+        for path in [p for p in index.ids if p not in current]:
+            index.remove(path)
+        for path in current:
+            index.add(path)
+
+    # --- REFS ---
+    def _list_refs(self):
+        # (branch names, tag names), all pages
+        found = []
+        for kind in ("branches", "tags"):
+            names = []
+            url = f"https://api.github.com/repos/{self.current_repo}/{kind}?per_page=100"
+            while url:
+                with self._api_open(url) as r:
+                    url = parse_next_link(r.headers.get("Link"))
+                    names += [x['name'] for x in JSONStreamReader(open_response_stream(r)).iter_array()]
+            found.append(names)
+        return found
+
+    def _apply_refs(self, branches, tags):
+        self.ref_branches = set(branches)
+        self.ref_tags = set(tags)
+        default = self.repo_info.get("default_branch")
+        branches = sorted(branches, key=lambda b: (b != default, b.lower()))
+        self.ref_combo.config(values=branches + sorted(tags, key=str.lower, reverse=True))
+        if not self.current_ref:
+            self.ref_combo.set(default or "")
+        self.remote_frame.config(text=self._remote_title())
+
+    def on_ref_selected(self, event=None):
+        ref = self.ref_combo.get().strip()
+        if ref == self.repo_info.get("default_branch"):
+            ref = ""
+        if ref == self.current_ref: return
+        self.current_ref = ref
+        self.current_remote_path = ""
+        self.remote_view_path = None # Same paths at another ref: rebuild the rows
+        self.clear_search()
+        self.refresh_remote()
+
+    def _ref(self):
+        # Ref being browsed. HEAD resolves to the default branch.
+        return self.current_ref or "HEAD"
+
+    def _remote_title(self):
+        if not self.current_ref:
+            return " GitHub Remote "
+        if self.current_ref in self.ref_branches:
+            return f" GitHub Remote [{self.current_ref}] "
+        return f" GitHub Remote [{self.current_ref}] (read-only) "
+
+    def _check_writable(self):
+        # Tags and commits are snapshots: only branches can be modified
+        if not self.current_ref or self.current_ref in self.ref_branches:
+            return True
+        messagebox.showwarning("Read-only", f"'{self.current_ref}' is a tag or a commit, it cannot be modified.\n\nSelect a branch to upload, delete or reset history.")
+        return False
+
     def go_up_remote(self):
         if not self.current_remote_path: return # Already root
         # split by / and remove last
@@ -572,11 +2770,57 @@ class GitHubManager:
             # Tag 1 is full path
             self.current_remote_path = item['tags'][1]
             self.refresh_remote()
+        else:
+            self.preview_remote()
 
     # --- ACTIONS ---
+    def preview_remote(self):
+        sel = self.tree_remote.selection()
+        if not sel: return
+        item = self.tree_remote.item(sel[0])
+        if item['values'][0] == 'dir': return
+        
+        r_path = item['tags'][1]
+        entry = next((x for x in self.remote_cache if x['path'] == r_path), {})
+        # Raw endpoint supports Range requests (the contents API does not)
+        url = f"https://raw.githubusercontent.com/{self.current_repo}/{self._ref()}/{urllib.parse.quote(r_path)}"
+        RemotePreview(self, r_path, entry.get('sha'), entry.get('size', 0), url, {"Authorization": f"Bearer {self.token}"})
+
+    def offer_resume_jobs(self):
+        # Jobs interrupted by a crash or a closed app left their journal behind
+        for path, plan, done in TransferJournal.pending(self.current_repo):
+            kind = plan.get("kind")
+            items = plan.get("items", [])
+            # The job writes to the branch it started on, not to the one selected now
+            branch = plan.get("branch") or self.repo_info.get("default_branch") or "main"
+            if branch not in self.ref_branches:
+                # Branch deleted since, or the refs could not be listed: keep the journal for a later connect
+                print(f"Interrupted {kind} job on '{branch}' not offered: branch not found")
+                continue
+            ans = messagebox.askyesnocancel("Resume Interrupted Job",
+                f"An interrupted {kind} job was found on '{branch}' ({plan.get('created', '?')}).\n\n"
+                f"Selected items: {len(items)}\nFiles already done: {len(done)}\n\n"
+                f"Yes: resume where it stopped\nNo: discard it\nCancel: ask again next time")
+            if ans is None:
+                continue
+            journal = TransferJournal(path, plan, done)
+            if not ans:
+                journal.close()
+                continue
+            if kind == "upload":
+                threading.Thread(target=self._upload_items_thread, args=(items, branch, journal), daemon=True).start()
+            elif kind == "delete":
+                threading.Thread(target=self._delete_items_thread, args=(items, branch, journal), daemon=True).start()
+            else:
+                journal.close(keep=True)
+                continue
+            break # One resumed job at a time, the others are offered on the next connect
+
     def delete_remote(self):
         sel = self.tree_remote.selection()
         if not sel: return
+        if not self._check_writable(): return
+        branch = self._branch() # Resolved once: the ref combo may change while the job runs
         
         items_to_delete = []
         for s in sel:
@@ -598,74 +2842,187 @@ class GitHubManager:
         count = len(items_to_delete)
         if count == 0: return
         
-        if count > 1:
-            if not messagebox.askyesno("Delete Multiple", f"⚠️ DANGER: Delete {count} items?\n\nIncludes folders which will be recursively deleted.\nThis cannot be undone."): return
+        if count == 1 and items_to_delete[0]['type'] != 'dir':
+            if not messagebox.askyesno("Delete", f"Delete remote file '{items_to_delete[0]['name']}'?"): return
+            threading.Thread(target=self._delete_items_thread, args=(items_to_delete, branch), daemon=True).start()
+            return
+        
+        # Several items or a folder: dry run first, the confirmation shows what it will cost
+        def _plan():
+            self.status_var.set(f"Planning delete of {count} items...")
+            try:
+                plan = self._plan_delete(items_to_delete)
+            except Exception as e:
+                self.status_var.set(f"Planning Error: {e}")
+                return
+            self.status_var.set("Delete plan ready.")
+            self.root.after(0, lambda: self._confirm_delete(items_to_delete, branch, plan))
+        threading.Thread(target=_plan, daemon=True).start()
+
+    def move_remote(self, copy=False):
+        # Move/rename/copy on the server: new tree entries point at the existing blob/tree SHAs,
+        # so any amount of content is handled by one commit without transferring it
+        sel = self.tree_remote.selection()
+        if not sel: return
+        if not self._check_writable(): return
+        paths = [self.tree_remote.item(s)['tags'][1] for s in sel]
+        verb = "Copy" if copy else "Move"
+        
+        if len(paths) == 1:
+            new = simpledialog.askstring(f"{verb} Remote", f"New path for '{paths[0]}':", initialvalue=paths[0])
+            if new is None: return
+            targets = [(paths[0], new.strip().strip("/"))]
         else:
-             # Single item checks
-             it = items_to_delete[0]
-             if it['type'] == 'dir':
-                  if not messagebox.askyesno("Recursive Delete", f"⚠️ DANGER: Delete folder '{it['name']}' and ALL its contents?\n\nThis cannot be undone."): return
-             else:
-                  if not messagebox.askyesno("Delete", f"Delete remote file '{it['name']}'?"): return
+            dest = simpledialog.askstring(f"{verb} Remote", f"{verb} {len(paths)} items to folder (empty = root):",
+                                          initialvalue=self.current_remote_path)
+            if dest is None: return
+            dest = dest.strip().strip("/")
+            targets = [(p, f"{dest}/{p.rsplit('/', 1)[-1]}" if dest else p.rsplit('/', 1)[-1]) for p in paths]
+        
+        targets = [(old, new) for old, new in targets if new and new != old]
+        for old, new in targets:
+            if new.startswith(old + "/"):
+                messagebox.showerror("Error", f"Cannot {verb.lower()} '{old}' into itself.")
+                return
+        if not targets: return
+        threading.Thread(target=self._move_thread, args=(targets, copy), daemon=True).start()
+
+    def _move_thread(self, targets, copy):
+        verb = "Copy" if copy else "Move"
+        self.status_var.set(f"{verb}: preparing {len(targets)} items...")
+        branch = self._branch()
+        listings = {} # parent path -> {path: listing item}, at the branch head
+        
+        def _entry(path):
+            parent = path.rsplit('/', 1)[0] if '/' in path else ""
+            if parent not in listings:
+                try:
+                    listings[parent] = {x['path']: x for x in self._list_remote(parent, branch)}
+                except Exception:
+                    listings[parent] = {} # Parent does not exist (yet)
+            return listings[parent].get(path)
+        
+        try:
+            kinds = {"dir": "tree", "file": "blob", "submodule": "commit"}
+            entries = []
+            for old, new in targets:
+                item = _entry(old)
+                if item is None:
+                    raise Exception(f"'{old}' not found on {branch}")
+                if _entry(new) is not None:
+                    raise Exception(f"'{new}' already exists")
+                mode = item.get('mode') or ("040000" if item['type'] == 'dir' else "100644")
+                entries.append({"path": new, "mode": mode, "type": kinds[item['type']], "sha": item['sha']})
+                if not copy:
+                    # sha None removes the old path (a whole subtree for folders)
+                    entries.append({"path": old, "mode": mode, "type": kinds[item['type']], "sha": None})
+            
+            if len(targets) == 1:
+                old, new = targets[0]
+                same_folder = os.path.dirname(old) == os.path.dirname(new) # Remote paths use '/'
+                message = f"{'Rename' if same_folder and not copy else verb} {old} -> {new}"
+            else:
+                message = f"{verb} {len(targets)} items"
+            self.status_var.set(f"{verb}: committing {len(targets)} items...")
+            self._commit_tree_entries(entries, message, branch)
+            self.status_var.set(f"{message} (done, no content transferred)")
+            self.root.after(0, self.refresh_remote)
+        except Exception as e:
+            self.status_var.set(f"{verb} Error: {e}")
+            self.root.after(0, lambda: messagebox.showerror(f"{verb} Error", str(e)))
+
+    def _plan_delete(self, items):
+        # Dry run of a delete: files and folders it will touch, from the (recursive) trees of the selected folders
+        plan = {"files": 0, "folders": 0, "partial": False}
+        for item in items:
+            if item['type'] != 'dir':
+                plan["files"] += 1
+                continue
+            plan["folders"] += 1
+            entries, truncated = self.api_tree(item['sha'])
+            plan["files"] += sum(1 for e in entries if e.type == "blob")
+            plan["folders"] += sum(1 for e in entries if e.type == "tree")
+            plan["partial"] |= truncated
+        # Contents API: one listing per folder, one DELETE per file
+        plan["calls"] = plan["files"] + plan["folders"]
+        return plan
 
-        threading.Thread(target=self._delete_items_thread, args=(items_to_delete,), daemon=True).start()
+    def _confirm_delete(self, items, branch, plan):
+        at_least = "at least " if plan["partial"] else ""
+        if len(items) == 1:
+            head = f"⚠️ DANGER: Delete folder '{items[0]['name']}' and ALL its contents?"
+        else:
+            head = f"⚠️ DANGER: Delete {len(items)} items?\n\nIncludes folders which will be recursively deleted."
+        summary = (f"{head}\n\nFiles to delete: {at_least}{plan['files']} in {plan['folders']} folders\n"
+                   f"{self.api_stats.describe(plan['calls'], 0)}\n\nThis cannot be undone.")
+        title = "Recursive Delete" if len(items) == 1 else "Delete Multiple"
+        if not messagebox.askyesno(title, summary, icon="warning"): return
+        threading.Thread(target=self._delete_items_thread, args=(items, branch), daemon=True).start()
 
-    def _delete_items_thread(self, items):
-        self.status_var.set(f"Deleting {len(items)} items...")
+    def _delete_items_thread(self, items, branch, journal=None):
+        # journal is given when resuming an interrupted job
+        if journal is None:
+            journal = TransferJournal.start("delete", self.current_repo, items=items, branch=branch)
+        self.progress.begin(message=f"Deleting {len(items)} items...")
         total = 0
         errors = 0
         
         try:
             for item in items:
                 if item['type'] == 'dir':
-                    c, e = self._delete_folder_recursive_sync(item['path'])
+                    c, e = self._delete_folder_recursive_sync(item['path'], branch, journal)
                     total += c
                     errors += e
                 else:
                     try:
-                        self.status_var.set(f"Deleting {item['name']}...")
-                        self._delete_file_sync(item['path'], item['sha'], item['name'])
+                        self.progress.set_message(f"Deleting {item['name']}...")
+                        self._delete_file_sync(item['path'], item['sha'], item['name'], branch, journal)
                         total += 1
                     except Exception as e:
                         print(f"Failed to delete {item['name']}: {e}")
                         errors += 1
-                        
+            
+            journal.close(keep=errors > 0)
             self.root.after(0, self.refresh_remote)
-            self.status_var.set(f"Deleted {total} files. Errors: {errors}")
+            self.progress.end(f"Deleted {total} files. Errors: {errors}")
             if total > 0 or errors > 0:
                  self.root.after(0, lambda: messagebox.showinfo("Deleted", f"Deletion Complete.\nFiles Deleted: {total}\nErrors: {errors}"))
                  
         except Exception as e:
-            self.status_var.set(f"Batch Delete Error: {e}")
-
-    def _delete_file_sync(self, path, sha, name):
-         if not sha: raise Exception("Missing SHA")
-         data = {"message": f"Delete {name}", "sha": sha}
-         url = f"https://api.github.com/repos/{self.current_repo}/contents/{path}"
-         
-         req = urllib.request.Request(url, method="DELETE", data=json.dumps(data).encode())
-         req.add_header("Authorization", f"Bearer {self.token}")
-         urllib.request.urlopen(req)
-
-    def _delete_folder_recursive_sync(self, folder_path):
-        self.status_var.set(f"Scanning {folder_path}...")
+            journal.close(keep=True)
+            self.progress.end(f"Batch Delete Error: {e}")
+
+    def _delete_file_sync(self, path, sha, name, branch, journal=None):
+         self.progress.add_total(items_total=1)
+         try:
+             if journal and path in journal.done: return # Deleted before the interruption
+             if not sha: raise Exception("Missing SHA")
+             data = {"message": f"Delete {name}", "sha": sha, "branch": branch}
+             url = f"https://api.github.com/repos/{self.current_repo}/contents/{path}"
+             self.api_request(url, "DELETE", data) # Through _api_open: timed and rate limit tracked
+             if journal: journal.mark(path)
+         finally:
+             self.progress.item_done()
+
+    def _delete_folder_recursive_sync(self, folder_path, branch, journal=None):
+        self.progress.set_message(f"Scanning {folder_path}...")
         count = 0
         errors = 0
         try:
             # 1. Get contents
-            url = f"https://api.github.com/repos/{self.current_repo}/contents/{folder_path}"
+            url = f"https://api.github.com/repos/{self.current_repo}/contents/{folder_path}?ref={urllib.parse.quote(branch)}"
             items = self.api_request(url)
             if not isinstance(items, list): items = [items]
             
             for item in items:
                 if item['type'] == 'dir':
-                    c, e = self._delete_folder_recursive_sync(item['path'])
+                    c, e = self._delete_folder_recursive_sync(item['path'], branch, journal)
                     count += c
                     errors += e
                 else:
-                    self.status_var.set(f"Deleting {item['name']}...")
+                    self.progress.set_message(f"Deleting {item['name']}...")
                     try:
-                        self._delete_file_sync(item['path'], item['sha'], item['name'])
+                        self._delete_file_sync(item['path'], item['sha'], item['name'], branch, journal)
                         count += 1
                     except Exception as e:
                         print(e)
@@ -679,6 +3036,8 @@ class GitHubManager:
     def upload_selection(self):
         sel = self.tree_local.selection()
         if not sel: return
+        if not self._check_writable(): return
+        branch = self._branch() # Resolved once: the ref combo may change while the job runs
         
         # Gather all selected paths
         items_to_upload = []
@@ -696,105 +3055,310 @@ class GitHubManager:
             items_to_upload.insert(0, gitignore_path)
             
         count = len(items_to_upload)
-        if count > 1:
-            if not messagebox.askyesno("Upload Multiple", f"Upload {count} items?"): return
-            
-        # If single folder, ask recursive (legacy behavior preservation mostly)
-        if count == 1 and os.path.isdir(items_to_upload[0]):
-             if not messagebox.askyesno("Upload Folder", f"Upload folder '{os.path.basename(items_to_upload[0])}' and all contents?"): return
+        if count == 1 and not os.path.isdir(items_to_upload[0]):
+            threading.Thread(target=self._upload_items_thread, args=(items_to_upload, branch), daemon=True).start()
+            return
+        
+        # Several items or a folder: dry run first, the confirmation shows what it will cost
+        local_base = self.current_local_path
+        remote_base = self.current_remote_path
+        
+        def _plan():
+            self.status_var.set(f"Planning upload of {count} items (scanning, hashing, comparing)...")
+            try:
+                plan = self._plan_upload(items_to_upload, local_base, remote_base, branch)
+            except Exception as e:
+                self.status_var.set(f"Planning Error: {e}")
+                return
+            self.status_var.set("Upload plan ready.")
+            self.root.after(0, lambda: self._confirm_upload(items_to_upload, plan))
+        threading.Thread(target=_plan, daemon=True).start()
 
-        threading.Thread(target=self._upload_items_thread, args=(items_to_upload,), daemon=True).start()
+    def _plan_upload(self, paths, local_base, remote_base, branch):
+        # Dry run of an upload: exact file list after gitignore and unchanged-file detection, plus its cost.
+        # The exact counts need every file hashed, so this is the full scan: the upload that follows
+        # reuses it instead of streaming its own (transfers start at confirmation, not during the scan).
+        lfs = GitAttributesChecker(local_base)
+        try:
+            _, head = self._get_head(branch)
+        except Exception:
+            head = None
+        index = self._remote_blob_index(branch)
+        counts = {"skipped": 0}
+        plan = {"local_base": local_base, "remote_base": remote_base, "branch": branch, "index": index, "head": head, "files": [],
+                "upload": 0, "unchanged": 0, "reuse": 0, "lfs": 0, "upload_bytes": 0, "lfs_bytes": 0}
+        
+        for local_path, remote_path, rel_path, size, blob_sha in self._iter_upload_files(paths, local_base, remote_base, counts):
+            if size is None:
+                size = os.path.getsize(local_path)
+            if lfs.is_lfs(rel_path):
+                # The tree holds the pointer: the same pointer at that path means the object is there too
+                remote_sha = index[1].get(remote_path) if index else None
+                if remote_sha and remote_sha == git_blob_sha(make_lfs_pointer(*lfs_oid(local_path))):
+                    plan["unchanged"] += 1
+                else:
+                    plan["lfs"] += 1
+                    plan["lfs_bytes"] += size
+            elif index:
+                by_sha, by_path = index
+                blob_sha = blob_sha or hash_file_blob(local_path)
+                if by_path.get(remote_path) == blob_sha:
+                    plan["unchanged"] += 1
+                elif blob_sha in by_sha:
+                    plan["reuse"] += 1
+                else:
+                    plan["upload"] += 1
+                    plan["upload_bytes"] += size
+            else:
+                plan["upload"] += 1
+                plan["upload_bytes"] += size
+            plan["files"].append((local_path, remote_path, rel_path, size, blob_sha))
+        plan["skipped"] = counts["skipped"]
+        
+        # Contents API: GET (existing SHA) + PUT per file, bodies in base64. LFS: batch call + pointer file.
+        calls = 2 * (plan["upload"] + plan["lfs"])
+        if plan["reuse"]: calls += PLAN_COMMIT_CALLS
+        plan["calls"] = calls
+        plan["bytes"] = plan["upload_bytes"] * 4 // 3 + plan["lfs_bytes"]
+        return plan
+
+    def _confirm_upload(self, paths, plan):
+        todo = plan["upload"] + plan["reuse"] + plan["lfs"]
+        if todo == 0:
+            messagebox.showinfo("Upload", f"Nothing to upload.\n\nUnchanged: {plan['unchanged']}\nIgnored: {plan['skipped']}")
+            return
+        summary = (f"Upload plan for {len(paths)} selected items (dry run):\n\n"
+                   f"To upload: {plan['upload']} files ({format_size(plan['upload_bytes'])})\n"
+                   f"Reuse existing remote content: {plan['reuse']}\n"
+                   f"LFS objects: {plan['lfs']} ({format_size(plan['lfs_bytes'])})\n"
+                   f"Unchanged (skipped): {plan['unchanged']}\n"
+                   f"Ignored by .gitignore: {plan['skipped']}\n\n"
+                   f"{self.api_stats.describe(plan['calls'], plan['bytes'])}\n\nProceed?")
+        if not messagebox.askyesno("Upload Plan", summary, icon="warning" if "⚠️" in summary else "question"): return
+        threading.Thread(target=self._upload_items_thread, args=(paths, plan["branch"], None, plan), daemon=True).start()
 
-    def _upload_items_thread(self, paths):
+    def _iter_upload_files(self, paths, local_base, remote_base, counts):
+        # Files of a selection after gitignore filtering: (local_path, remote_path, rel_path, size, blob_sha).
+        # Folders are walked and hashed in parallel, files come in as soon as they are hashed.
+        # size/blob_sha are None for directly selected files. Ignored items are added to counts["skipped"].
+        checker = GitIgnoreChecker(local_base)
+        for path in paths:
+            fname = os.path.basename(path)
+            
+            # Check if ignored (only if it's not the .gitignore itself)
+            if fname != ".gitignore" and checker.is_ignored(fname):
+                print(f"Skipping ignored item: {fname}")
+                counts["skipped"] += 1
+                continue
+            
+            if os.path.isdir(path):
+                remote_folder = f"{remote_base}/{fname}" if remote_base else fname
+                scanner = TreeScanner(path, checker, local_base)
+                for local_path, size, blob_sha in scanner:
+                    rel_path = os.path.relpath(local_path, local_base)
+                    # rel path from the folder preserves the subfolder structure
+                    rel_from_folder = os.path.relpath(local_path, path)
+                    remote_path = f"{remote_folder}/{rel_from_folder}".replace("\\", "/")
+                    yield local_path, remote_path, rel_path, size, blob_sha
+                counts["skipped"] += scanner.skipped
+            else:
+                # Single file, in the remote directory of the job
+                yield path, (f"{remote_base}/{fname}" if remote_base else fname), fname, None, None
+
+    def _upload_items_thread(self, paths, branch, journal=None, plan=None):
+        # journal is given when resuming an interrupted job, it holds the folders the job started from.
+        # plan comes from the dry run: its file list and remote index are used instead of scanning again.
+        if journal is None:
+            base = plan or {"local_base": self.current_local_path, "remote_base": self.current_remote_path}
+            journal = TransferJournal.start("upload", self.current_repo, items=paths, branch=branch,
+                                            local_base=base["local_base"], remote_base=base["remote_base"])
+        local_base = journal.plan["local_base"]
+        remote_base = journal.plan["remote_base"]
         total_files = 0
         total_errors = 0
-        skipped = 0
+        counts = {"skipped": plan["skipped"] if plan else 0}
         
-        # Initialize GitIgnoreChecker from current local path
-        checker = GitIgnoreChecker(self.current_local_path)
-        
-        self.status_var.set(f"Starting upload of {len(paths)} items...")
+        self.progress.begin(message=f"Starting upload of {len(paths)} items...")
         
         try:
-            for path in paths:
-                fname = os.path.basename(path)
-                
-                # Check if ignored (only if it's not the .gitignore itself)
-                if fname != ".gitignore" and checker.is_ignored(fname):
-                    print(f"Skipping ignored item: {fname}")
-                    skipped += 1
-                    continue
-
-                if os.path.isdir(path):
-                    f_count, f_err, f_skip = self._upload_folder_recursive_sync(path, checker)
-                    total_files += f_count
-                    total_errors += f_err
-                    skipped += f_skip
-                else:
-                    # Single file
-                    # Use current remote directory
-                    remote_full_path = f"{self.current_remote_path}/{fname}" if self.current_remote_path else fname
-                    self.status_var.set(f"Uploading {fname}...")
-                    try:
-                        self._upload_file(path, remote_full_path)
+            index = None
+            if plan and plan["index"]:
+                # The user may have waited on the dialog: the planned index only holds if the branch did not move
+                try:
+                    _, head = self._get_head(branch)
+                except Exception:
+                    head = None
+                if head and head == plan["head"]:
+                    index = plan["index"]
+            job = self._new_upload_job(local_base, remote_base, branch, journal, index)
+            files = plan["files"] if plan else self._iter_upload_files(paths, local_base, remote_base, counts)
+            
+            for local_path, remote_path, rel_path, size, blob_sha in files:
+                self.progress.set_message(f"Uploading {os.path.basename(local_path)}...")
+                try:
+                    if self._upload_one(local_path, remote_path, rel_path, job, size, blob_sha):
                         total_files += 1
-                    except Exception as e:
-                        print(f"Error uploading {fname}: {e}")
-                        total_errors += 1
+                except Exception as e:
+                    print(f"Error uploading {remote_path}: {e}")
+                    total_errors += 1
+            skipped = counts["skipped"]
+            
+            f_count, f_err = self._finish_upload_job(job)
+            total_files += f_count
+            total_errors += f_err
+            journal.close(keep=total_errors > 0)
             
             self.root.after(0, self.refresh_remote)
-            msg = f"Upload Complete.\nFiles: {total_files}\nErrors: {total_errors}\nIgnored: {skipped}"
-            self.status_var.set(f"Uploaded {total_files} files. Errors: {total_errors}. Ignored: {skipped}")
+            saved = format_size(job["saved"])
+            msg = (f"Upload Complete.\nFiles: {total_files}\nErrors: {total_errors}\nIgnored: {skipped}\n"
+                   f"Unchanged: {job['unchanged']}\nReused remote content: {len(job['reuse'])}\nBytes saved: {saved}")
+            if job["resumed"]:
+                msg += f"\nAlready done before resume: {job['resumed']}"
+            self.progress.end(f"Uploaded {total_files} files. Errors: {total_errors}. Ignored: {skipped}. Saved: {saved}")
             # Only show box if reasonable amount or errors
-            if total_files > 0 or total_errors > 0:
+            if total_files > 0 or total_errors > 0 or job["unchanged"] > 0:
                  self.root.after(0, lambda: messagebox.showinfo("Done", msg))
                  
         except Exception as e:
-            self.status_var.set(f"Upload Batch Error: {e}")
+            journal.close(keep=True)
+            self.progress.end(f"Upload Batch Error: {e}")
 
-    def _upload_folder_recursive_sync(self, local_folder, checker):
-        # Sync version of recursive upload, returns (count, errors, skipped)
-        base_name = os.path.basename(local_folder)
-        remote_base = f"{self.current_remote_path}/{base_name}" if self.current_remote_path else base_name
+    def _new_upload_job(self, local_base, remote_base, branch, journal, index=None):
+        # Shared state of one upload batch (index: remote index already fetched by the dry run)
+        return {
+            "local_base": local_base,
+            "remote_base": remote_base,
+            "branch": branch, # Every write of the job goes there, whatever the ref combo shows meanwhile
+            "journal": journal,
+            "resumed": 0, # Files skipped because the journal has them as done
+            "lfs": GitAttributesChecker(local_base),
+            "lfs_queue": [], # (local_path, remote_path, oid, size), pushed together at the end
+            "index": index or self._remote_blob_index(branch), # Content already in the repo, or None
+            "reuse": [], # Tree entries pointing at existing blobs, committed together at the end
+            "unchanged": 0,
+            "saved": 0 # Bytes that did not need to be sent
+        }
+
+    def _upload_one(self, local_path, remote_path, rel_path, job, size=None, blob_sha=None):
+        # Uploads one file unless its content already exists remotely.
+        # size/blob_sha come from the pre-scan when known. Returns True if it was sent right away.
+        if size is None:
+            size = os.path.getsize(local_path)
+        self.progress.add_total(size, 1)
+        if remote_path in job["journal"].done:
+            job["resumed"] += 1
+            self.progress.add_bytes(size, False)
+            self.progress.item_done()
+            return False
+        if job["lfs"].is_lfs(rel_path):
+            oid = lfs_size = None
+            if job["index"] and remote_path in job["index"][1]:
+                try:
+                    oid, lfs_size = lfs_oid(local_path)
+                except OSError as e:
+                    print(f"LFS hash error for {local_path}: {e}") # Hashed again (and reported) when pushing
+                if oid and job["index"][1].get(remote_path) == git_blob_sha(make_lfs_pointer(oid, lfs_size)):
+                    # Same pointer already committed there, so its object is on the server too
+                    job["unchanged"] += 1
+                    job["saved"] += size
+                    self.progress.add_bytes(size, False)
+                    self.progress.item_done()
+                    job["journal"].mark(remote_path)
+                    return False
+            job["lfs_queue"].append((local_path, remote_path, oid, lfs_size))
+            return False
         
+        try:
+            if job["index"]:
+                by_sha, by_path = job["index"]
+                sha = blob_sha or hash_file_blob(local_path)
+                if by_path.get(remote_path) == sha:
+                    job["unchanged"] += 1
+                    job["saved"] += size
+                    self.progress.add_bytes(size, False)
+                    job["journal"].mark(remote_path)
+                    return False
+                if sha in by_sha:
+                    # Same content elsewhere in the repo (moved/copied): just reference the blob
+                    job["reuse"].append({"path": remote_path, "mode": by_sha[sha], "type": "blob", "sha": sha})
+                    job["saved"] += size
+                    self.progress.add_bytes(size, False)
+                    return False
+            
+            with open(local_path, 'rb') as f: content = f.read()
+            self._upload_file(local_path, remote_path, job["branch"], content=content)
+            self.progress.add_bytes(len(content))
+            job["journal"].mark(remote_path)
+            return True
+        finally:
+            self.progress.item_done()
+
+    def _finish_upload_job(self, job):
+        # Pushes the deferred parts of a batch, returns (count, errors)
         count = 0
         errors = 0
-        skipped = 0
+        if job["lfs_queue"]:
+            count, errors = self._upload_lfs_files(job["lfs_queue"], job["branch"], job["journal"])
         
-        for root, dirs, files in os.walk(local_folder):
-            # rel_dir is relative to the folder where .gitignore is (self.current_local_path)
-            rel_root = os.path.relpath(root, self.current_local_path)
-            
-            # Filter directories in-place for os.walk
-            dirs[:] = [d for d in dirs if not checker.is_ignored(os.path.join(rel_root, d))]
-            # We don't count skipped dirs here because they are not files, 
-            # but their contents will be skipped.
-
-            for file in files:
-                local_path = os.path.join(root, file)
-                rel_path = os.path.relpath(local_path, self.current_local_path)
-                
-                if checker.is_ignored(rel_path):
-                    print(f"Skipping ignored file: {rel_path}")
-                    skipped += 1
-                    continue
+        if job["reuse"]:
+            n = len(job["reuse"])
+            self.progress.set_message(f"Linking {n} files to existing content...")
+            try:
+                self._commit_tree_entries(job["reuse"], f"Upload {n} files (existing content)", job["branch"])
+                for entry in job["reuse"]:
+                    job["journal"].mark(entry["path"])
+                count += n
+            except Exception as e:
+                print(f"Error committing reused blobs: {e}")
+                errors += n
+        return count, errors
 
-                # Remote path relative to current_remote_path
-                # We need rel path from local_folder to preserve subfolder structure
-                rel_from_folder = os.path.relpath(local_path, local_folder)
-                remote_path = f"{remote_base}/{rel_from_folder}".replace("\\", "/")
-                
-                self.status_var.set(f"Uploading {file}...")
-                try:
-                    self._upload_file(local_path, remote_path)
-                    count += 1
-                except Exception as ex:
-                    print(ex)
-                    errors += 1
-        return count, errors, skipped
-
-    def _upload_file(self, local_path, remote_path):
+    # --- GIT DATA ---
+    def _branch(self):
+        # Branch that writes go to: the selected one, or the default branch
+        if self.current_ref in self.ref_branches:
+            return self.current_ref
+        return self.repo_info.get("default_branch") or "main"
+
+    def _get_head(self, ref=None):
+        # Returns (commit_sha, tree_sha) of a branch head, tag or commit (defaults to the write branch)
+        commit_sha = self.api_ref_sha(ref or self._branch())
+        tree_sha = self.commit_trees.get(commit_sha)
+        if tree_sha is None:
+            commit = self.api_request(f"https://api.github.com/repos/{self.current_repo}/git/commits/{commit_sha}")
+            tree_sha = self.commit_trees[commit_sha] = commit['tree']['sha']
+        return commit_sha, tree_sha
+
+    def _remote_blob_index(self, branch):
+        # ({blob_sha: mode}, {path: blob_sha}) for the branch head, or None if unavailable
+        try:
+            _, tree_sha = self._get_head(branch)
+            entries, truncated = self.api_tree(tree_sha)
+        except Exception as e:
+            print(f"Remote index unavailable: {e}")
+            return None
+        if truncated:
+            print("Remote tree truncated, content detection is partial")
+        by_sha = {}
+        by_path = {}
+        for e in entries:
+            if e.type == "blob" and e.mode in ("100644", "100755"):
+                by_sha.setdefault(e.sha, e.mode)
+                by_path[e.path] = e.sha
+        return by_sha, by_path
+
+    def _commit_tree_entries(self, entries, message, branch):
+        # One commit on top of the branch head that applies tree entries (sha None deletes a path)
+        base = f"https://api.github.com/repos/{self.current_repo}/git"
+        head_sha, tree_sha = self._get_head(branch)
+        tree = self.api_request(f"{base}/trees", "POST", {"base_tree": tree_sha, "tree": entries})
+        commit = self.api_request(f"{base}/commits", "POST", {"message": message, "tree": tree['sha'], "parents": [head_sha]})
+        self.api_request(f"{base}/refs/heads/{branch}", "PATCH", {"sha": commit['sha']})
+        return commit['sha']
+
+    def _upload_file(self, local_path, remote_path, branch, content=None):
         # Helper to upload one file (no threading spawn here, logic only)
+        # content overrides the bytes read from local_path (used for LFS pointers)
         # Check SHA first to see if update
         sha = None
         # This check against cache is only valid for current view, but for recursive uploads
@@ -805,30 +3369,78 @@ class GitHubManager:
         
         # 1. Get SHA if exists
         try:
-           url = f"https://api.github.com/repos/{self.current_repo}/contents/{remote_path}"
+           url = f"https://api.github.com/repos/{self.current_repo}/contents/{remote_path}?ref={urllib.parse.quote(branch)}"
            res = self.api_request(url)
            sha = res['sha']
         except: 
            pass # File likely doesn't exist
            
         # 2. Upload
-        with open(local_path, 'rb') as f: content = f.read()
+        if content is None:
+            with open(local_path, 'rb') as f: content = f.read()
         b64 = base64.b64encode(content).decode()
         
-        data = {"message": f"Upload {os.path.basename(local_path)}", "content": b64}
+        data = {"message": f"Upload {os.path.basename(local_path)}", "content": b64, "branch": branch}
         if sha: data["sha"] = sha
         
         url = f"https://api.github.com/repos/{self.current_repo}/contents/{remote_path}"
         self.api_request(url, "PUT", data)
 
+    # --- GIT LFS ---
+    def _lfs_client(self, repo=None):
+        endpoint = self.lfs_url or f"https://github.com/{repo or self.current_repo}.git/info/lfs"
+        # LFS servers use Basic auth, GitHub accepts the token as password
+        creds = base64.b64encode(f"{self.username or 'x-access-token'}:{self.token}".encode()).decode()
+        return LFSClient(endpoint, f"Basic {creds}", self.progress.add_bytes)
+
+    def _upload_lfs_files(self, queued, branch, journal=None):
+        # queued: list of (local_path, remote_path, oid, size), oid/size None if not hashed yet. Returns (count, errors)
+        self.progress.set_message(f"Hashing {len(queued)} LFS files...")
+        files = []
+        errors = 0
+        for local_path, remote_path, oid, size in queued:
+            try:
+                if oid is None:
+                    oid, size = lfs_oid(local_path)
+                files.append((local_path, remote_path, oid, size))
+            except Exception as e:
+                print(f"LFS hash error for {local_path}: {e}")
+                errors += 1
+                self.progress.item_done()
+
+        # 1. Push objects in parallel through the batch API
+        self.progress.set_message(f"Pushing {len(files)} LFS objects...")
+        try:
+            self._lfs_client().upload([(p, oid, size) for p, _, oid, size in files])
+        except Exception as e:
+            print(e)
+            self.progress.item_done(len(files))
+            return 0, errors + len(files)
+
+        # 2. Commit the pointer files in place of the binaries
+        count = 0
+        for local_path, remote_path, oid, size in files:
+            self.progress.set_message(f"Uploading LFS pointer {os.path.basename(local_path)}...")
+            try:
+                self._upload_file(local_path, remote_path, branch, content=make_lfs_pointer(oid, size))
+                if journal: journal.mark(remote_path)
+                count += 1
+            except Exception as e:
+                print(f"Error uploading LFS pointer {remote_path}: {e}")
+                errors += 1
+            self.progress.item_done()
+        return count, errors
+
     def reset_history(self):
-        if not messagebox.askyesno("DANGER", "⚡ RESET HISTORY?\n\nThis will:\n1. Keep all current files exactly as they are.\n2. DELETE all previous commit history.\n3. Create a single fresh commit (v1.0).\n\nAre you sure?"): return
+        if not self._check_writable(): return
+        branch = self._branch()
+        if not messagebox.askyesno("DANGER", f"⚡ RESET HISTORY of '{branch}'?\n\nThis will:\n1. Keep all current files exactly as they are.\n2. DELETE all previous commit history.\n3. Create a single fresh commit (v1.0).\n\nAre you sure?"): return
         
         def _reset():
             self.status_var.set("Reseting History...")
             try:
                 # 1. Get current Head Commit
-                ref = self.api_request(f"https://api.github.com/repos/{self.current_repo}/git/refs/heads/main")
+                ref = self.api_request(f"https://api.github.com/repos/{self.current_repo}/git/refs/heads/{branch}")
                 latest_commit_sha = ref['object']['sha']
                 
                 # 2. Get Tree of that commit
@@ -846,7 +3458,7 @@ class GitHubManager:
                 
                 # 4. Force Update Ref
                 ref_data = {"sha": new_sha, "force": True}
-                self.api_request(f"https://api.github.com/repos/{self.current_repo}/git/refs/heads/main", "PATCH", ref_data)
+                self.api_request(f"https://api.github.com/repos/{self.current_repo}/git/refs/heads/{branch}", "PATCH", ref_data)
                 
                 self.status_var.set("History Reset Successful!")
                 messagebox.showinfo("Success", "History has been reset to a single commit.")
@@ -866,6 +3478,7 @@ class GitHubManager:
         
         r_path = item['tags'][1]
         name = item['tags'][2]
+        sha = next((x['sha'] for x in self.remote_cache if x['path'] == r_path), None)
         
         save_path = os.path.join(self.current_local_path, name)
         
@@ -873,22 +3486,42 @@ class GitHubManager:
             if not messagebox.askyesno("Overwrite", f"File '{name}' exists locally. Overwrite?"): return
             
         def _down():
+            self.progress.begin(items_total=1, message=f"Downloading {name}...")
             try:
-                # Get Blob URL/Content
-                url = f"https://api.github.com/repos/{self.current_repo}/contents/{r_path}"
-                res = self.api_request(url) # This returns content in base64
-                
-                content = base64.b64decode(res['content'])
-                with open(save_path, 'wb') as f:
-                    f.write(content)
+                content = self._get_blob(sha, r_path)
+                pointer = parse_lfs_pointer(content)
+                if pointer:
+                    # LFS pointer: fetch the real object
+                    self.progress.set_message(f"Fetching LFS object for {name}...")
+                    oid, size = pointer
+                    self.progress.add_total(size)
+                    self._lfs_client().download([(oid, size, save_path)])
+                else:
+                    with open(save_path, 'wb') as f:
+                        f.write(content)
+                self.progress.item_done()
                     
                 self.root.after(0, self.refresh_local)
-                self.status_var.set(f"Downloaded {name}")
+                self.progress.end(f"Downloaded {name}")
             except Exception as e:
-                self.status_var.set(f"Download error: {e}")
+                self.progress.end(f"Download error: {e}")
 
         threading.Thread(target=_down, daemon=True).start()
 
+    def _get_blob(self, sha, path):
+        # File content by blob SHA, served from the local cache when known
+        content = self.blob_cache.get(sha)
+        if content is not None:
+            return content
+        
+        if sha:
+            res = self.api_request(f"https://api.github.com/repos/{self.current_repo}/git/blobs/{sha}")
+        else:
+            res = self.api_request(f"https://api.github.com/repos/{self.current_repo}/contents/{path}?ref={urllib.parse.quote(self._ref())}")
+        content = base64.b64decode(res['content']) # Returned in base64
+        self.blob_cache.put(sha or res.get('sha'), content)
+        return content
+
     # --- RELEASES ---
     def refresh_releases(self):
         if not self.token: return
@@ -897,6 +3530,7 @@ class GitHubManager:
     def _releases_thread(self):
         try:
             res = self.api_request(f"https://api.github.com/repos/{self.current_repo}/releases")
+            self.releases_cache = res
             self.root.after(0, lambda: self._populate_releases(res))
         except: pass
 
@@ -976,46 +3610,105 @@ class GitHubManager:
                     
                     # Streaming upload with Progress Tracking
                     file_size = os.path.getsize(asset_path)
-                    start_time = datetime.datetime.now()
                     
                     self.root.after(0, lambda: self.progress_frame.pack(fill=tk.X, padx=10, pady=5))
-                    
-                    def progress_cb(bytes_read, total):
-                        elapsed = (datetime.datetime.now() - start_time).total_seconds()
-                        percent = (bytes_read / total) * 100
-                        speed = bytes_read / elapsed if elapsed > 0 else 0
-                        eta = (total - bytes_read) / speed if speed > 0 else 0
-                        
-                        speed_mb = speed / (1024 * 1024)
-                        eta_str = str(datetime.timedelta(seconds=int(eta)))
-                        status_text = f"{percent:.1f}% | {speed_mb:.2f} MB/s | ETA: {eta_str}"
-                        
-                        self.root.after(0, lambda: [
-                            self.progress_bar.configure(value=percent),
-                            self.progress_label.configure(text=status_text)
-                        ])
-
-                    with open(asset_path, 'rb') as f:
-                        wrapped_file = ProgressFileWrapper(f, file_size, progress_cb)
-                        req = urllib.request.Request(up_url, data=wrapped_file, method="POST")
-                        req.add_header("Authorization", f"Bearer {self.token}")
-                        req.add_header("Content-Type", "application/octet-stream")
-                        req.add_header("Content-Length", str(file_size))
-                        
-                        with urllib.request.urlopen(req) as response:
-                            response.read()
+                    self.progress.begin(file_size, 1, f"Uploading asset {fname}...")
+                    try:
+                        with open(asset_path, 'rb') as f:
+                            wrapped_file = ProgressFileWrapper(f, file_size, self.progress.add_bytes)
+                            req = urllib.request.Request(up_url, data=wrapped_file, method="POST")
+                            req.add_header("Authorization", f"Bearer {self.token}")
+                            req.add_header("Content-Type", "application/octet-stream")
+                            req.add_header("Content-Length", str(file_size))
+                            
+                            with urllib.request.urlopen(req) as response:
+                                response.read()
+                        self.progress.item_done()
+                    finally:
+                        self.progress.end()
                     
                     self.root.after(0, self.progress_frame.pack_forget)
                 
                 self.root.after(0, self.refresh_releases)
-                self.status_var.set("Release Published/Updated!")
+                self.progress.set_message("Release Published/Updated!")
                 
             except Exception as e:
                 self.root.after(0, self.progress_frame.pack_forget)
-                self.status_var.set(f"Release Error: {e}")
+                self.progress.set_message(f"Release Error: {e}")
                 
         threading.Thread(target=_pub, daemon=True).start()
 
+    def download_asset(self):
+        sel = self.tree_releases.selection()
+        if not sel: return
+        id_ = str(self.tree_releases.item(sel[0])['tags'][0])
+        release = next((r for r in self.releases_cache if str(r['id']) == id_), None)
+        if not release or not release['assets']:
+            messagebox.showinfo("Download Asset", "This release has no assets.")
+            return
+        
+        assets = release['assets']
+        asset = assets[0]
+        if len(assets) > 1:
+            names = [a['name'] for a in assets]
+            choice = simpledialog.askstring("Download Asset", "Asset to download:\n\n" + "\n".join(names), initialvalue=names[0])
+            if not choice: return
+            asset = next((a for a in assets if a['name'] == choice.strip()), None)
+            if not asset:
+                messagebox.showerror("Error", f"No asset named '{choice}'.")
+                return
+        
+        save_path = filedialog.asksaveasfilename(initialdir=self.current_local_path, initialfile=asset['name'])
+        if not save_path: return
+        
+        threading.Thread(target=self._download_asset_thread, args=(asset, save_path), daemon=True).start()
+
+    def _resolve_asset_url(self, asset):
+        # The API answers with a redirect to a pre-signed URL that must be fetched without our token
+        api_url = asset['url']
+        req = urllib.request.Request(api_url)
+        req.add_header("Authorization", f"Bearer {self.token}")
+        req.add_header("Accept", "application/octet-stream")
+        opener = urllib.request.build_opener(NoRedirectHandler)
+        try:
+            with opener.open(req) as r:
+                r.read(0)
+        except urllib.error.HTTPError as e:
+            if e.code in (301, 302, 303, 307, 308) and e.headers.get("Location"):
+                return e.headers["Location"], {}
+            raise
+        # Served directly (no redirect): keep auth
+        return api_url, {"Authorization": f"Bearer {self.token}", "Accept": "application/octet-stream"}
+
+    def _download_asset_thread(self, asset, save_path):
+        name = asset['name']
+        size = asset['size']
+        try:
+            self.status_var.set(f"Resolving {name}...")
+            url, headers = self._resolve_asset_url(asset)
+            
+            self.root.after(0, lambda: self.progress_frame.pack(fill=tk.X, padx=10, pady=5))
+            self.progress.begin(size, 1, f"Downloading {name} ({format_size(size)})...")
+            try:
+                # Segment workers all report into the shared progress
+                sha256 = SegmentedDownloader(url, size, save_path, headers, self.progress.add_bytes).run()
+                self.progress.item_done()
+            finally:
+                self.progress.end()
+            
+            # GitHub publishes a sha256 digest for newer assets
+            digest = asset.get("digest") or ""
+            if digest.startswith("sha256:") and digest[len("sha256:"):] != sha256:
+                os.remove(save_path)
+                raise Exception("Checksum mismatch, file removed.")
+            
+            self.root.after(0, self.progress_frame.pack_forget)
+            self.root.after(0, self.refresh_local)
+            self.progress.set_message(f"Downloaded {name} (sha256 {sha256[:12]}..., {'verified' if digest else 'no published digest'})")
+        except Exception as e:
+            self.root.after(0, self.progress_frame.pack_forget)
+            self.progress.set_message(f"Asset Download Error: {e}")
+
     def _get_release_by_tag(self, tag):
         # Fetch release details by tag
         try:
@@ -1023,33 +3716,17 @@ class GitHubManager:
         except:
             return None
 
-    def fetch_repo_data(self):
-        if not self.token or not self.current_repo: return
+    def _apply_repo_data(self, repo, names):
+        keep = ("description", "stargazers_count", "forks_count", "open_issues_count", "default_branch")
+        self.repo_info = {k: repo.get(k) for k in keep}
+        self.repo_topics = names
         
-        def _fetch():
-            try:
-                # 1. Get Repo Details (Description, etc)
-                repo = self.api_request(f"https://api.github.com/repos/{self.current_repo}")
-                desc = repo.get("description") or "No description."
-                stats = f"Stars: {repo.get('stargazers_count', 0)} | Forks: {repo.get('forks_count', 0)} | Issues: {repo.get('open_issues_count', 0)}"
-                
-                # 2. Get Topics
-                # Note: Mercury preview is enabled in api_request headers
-                topics_res = self.api_request(f"https://api.github.com/repos/{self.current_repo}/topics")
-                names = topics_res.get("names", [])
-                topics_str = ", ".join(names)
-                
-                self.root.after(0, lambda: [
-                    self.topics_entry.delete(0, tk.END),
-                    self.topics_entry.insert(0, topics_str),
-                    self.lbl_repo_desc.config(text=f"Description: {desc}"),
-                    self.lbl_repo_stats.config(text=stats)
-                ])
-                
-            except Exception as e:
-                print(f"Fetch Repo Data Error: {e}")
-                
-        threading.Thread(target=_fetch, daemon=True).start()
+        desc = repo.get("description") or "No description."
+        stats = f"Stars: {repo.get('stargazers_count', 0)} | Forks: {repo.get('forks_count', 0)} | Issues: {repo.get('open_issues_count', 0)}"
+        self.topics_entry.delete(0, tk.END)
+        self.topics_entry.insert(0, ", ".join(names))
+        self.lbl_repo_desc.config(text=f"Description: {desc}")
+        self.lbl_repo_stats.config(text=stats)
 
     def update_topics(self):
         if not self.token or not self.current_repo: return
@@ -1072,12 +3749,349 @@ class GitHubManager:
                 
         threading.Thread(target=_update, daemon=True).start()
 
+    # --- HISTORY ---
+    def refresh_history(self):
+        if not self.token or not self.current_repo: return
+        ref = self._ref()
+        self.history = {"key": (self.current_repo, ref), "commits": [], "next": None, "loading": False, "offset": 0, "selected": None}
+        self.history_detail.delete("1.0", tk.END)
+        self._render_history()
+        params = urllib.parse.urlencode({"sha": ref, "per_page": HISTORY_PAGE_SIZE})
+        self._load_history_page(f"https://api.github.com/repos/{self.current_repo}/commits?{params}")
+
+    def _load_history_page(self, url):
+        if self.history["loading"] or not url: return
+        self.history["loading"] = True
+        key = self.history["key"]
+        self.lbl_history.config(text=f"{len(self.history['commits'])} commits loaded, loading more...")
+        
+        def _fetch():
+            try:
+                records, next_url = self.api_commit_page(url)
+                self.root.after(0, lambda: self._add_history_page(key, records, next_url))
+            except Exception as e:
+                self.status_var.set(f"History Error: {e}")
+                self.root.after(0, lambda: self.history.update(loading=False))
+        threading.Thread(target=_fetch, daemon=True).start()
+
+    def _add_history_page(self, key, records, next_url):
+        if self.history["key"] != key: return # Branch/repo changed meanwhile
+        self.history["commits"].extend(records)
+        self.history["next"] = next_url
+        self.history["loading"] = False
+        self._render_history()
+
+    @profiled("render_history")
+    def _render_history(self):
+        h = self.history
+        commits = h["commits"]
+        total = len(commits)
+        h["offset"] = max(0, min(h["offset"], total - HISTORY_VISIBLE_ROWS))
+        
+        for row, iid in enumerate(self.history_rows):
+            index = h["offset"] + row
+            if index < total:
+                c = commits[index]
+                date = c.date.replace("T", " ")[:16]
+                self.tree_history.item(iid, values=(c.sha[:7], date, c.author, c.message.split("\n", 1)[0]))
+            else:
+                self.tree_history.item(iid, values=("", "", "", ""))
+        
+        # Keep the selected commit highlighted while its row is visible
+        sel = h["selected"]
+        if sel is not None and h["offset"] <= sel < h["offset"] + HISTORY_VISIBLE_ROWS:
+            self.tree_history.selection_set(self.history_rows[sel - h["offset"]])
+        elif self.tree_history.selection():
+            self.tree_history.selection_remove(*self.tree_history.selection())
+        
+        if total:
+            self.history_scroll.set(h["offset"] / total, min(1.0, (h["offset"] + HISTORY_VISIBLE_ROWS) / total))
+        else:
+            self.history_scroll.set(0, 1)
+        more = "+" if h["next"] else ""
+        self.lbl_history.config(text=f"{total}{more} commits on {h['key'][1] if h['key'] else '-'}")
+        
+        # Fetch the next page before the end of the list becomes visible
+        if h["next"] and h["offset"] + 2 * HISTORY_VISIBLE_ROWS >= total:
+            self._load_history_page(h["next"])
+
+    def _history_yview(self, *args):
+        total = len(self.history["commits"])
+        if args[0] == "moveto":
+            self.history["offset"] = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = HISTORY_VISIBLE_ROWS if args[2] == "pages" else 1
+            self.history["offset"] += int(args[1]) * step
+        self._render_history()
+
+    def _history_scroll_by(self, rows):
+        self.history["offset"] += rows * 3
+        self._render_history()
+
+    def _history_move_selection(self, delta):
+        h = self.history
+        if not h["commits"]: return
+        index = min(len(h["commits"]) - 1, max(0, (h["selected"] if h["selected"] is not None else -1) + delta))
+        if index < h["offset"]:
+            h["offset"] = index
+        elif index >= h["offset"] + HISTORY_VISIBLE_ROWS:
+            h["offset"] = index - HISTORY_VISIBLE_ROWS + 1
+        self._select_history(index)
+
+    def _on_history_select(self, event):
+        sel = self.tree_history.selection()
+        if not sel: return
+        index = self.history["offset"] + self.history_rows.index(sel[0])
+        if index != self.history["selected"] and index < len(self.history["commits"]):
+            self._select_history(index)
+
+    def _select_history(self, index):
+        self.history["selected"] = index
+        self._render_history()
+        sha = self.history["commits"][index].sha
+        
+        cached = self.commit_cache.get(sha)
+        if cached:
+            self._show_commit_detail(cached)
+            return
+        self.history_detail.delete("1.0", tk.END)
+        self.history_detail.insert("1.0", f"Loading {sha}...")
+        
+        def _fetch():
+            try:
+                res = self.api_request(f"https://api.github.com/repos/{self.current_repo}/commits/{sha}")
+                c = res['commit']
+                detail = {
+                    "sha": res['sha'],
+                    "author": c['author']['name'],
+                    "email": c['author']['email'],
+                    "date": c['author']['date'],
+                    "message": c['message'],
+                    "parents": [p['sha'] for p in res.get('parents', [])],
+                    "stats": res.get('stats', {}),
+                    "files": [{k: f.get(k) for k in ("filename", "status", "additions", "deletions")} for f in res.get('files', [])]
+                }
+                self.commit_cache.put(sha, detail)
+                self.root.after(0, lambda: self._show_commit_detail(detail))
+            except Exception as e:
+                self.status_var.set(f"Commit Error: {e}")
+        threading.Thread(target=_fetch, daemon=True).start()
+
+    def _show_commit_detail(self, d):
+        # Ignore late answers for a commit that is no longer selected
+        h = self.history
+        if h["selected"] is None or h["commits"][h["selected"]].sha != d["sha"]: return
+        
+        stats = d.get("stats", {})
+        lines = [
+            f"commit {d['sha']}",
+            f"Author: {d['author']} <{d['email']}>",
+            f"Date:   {d['date']}",
+            f"Parents: {', '.join(p[:7] for p in d['parents']) or '(root)'}",
+            "",
+            *("    " + l for l in d['message'].splitlines()),
+            "",
+            f"{len(d['files'])} files changed, +{stats.get('additions', 0)} -{stats.get('deletions', 0)}"
+        ]
+        for f in d['files']:
+            lines.append(f" {f['status'][:1].upper()} {f['filename']} (+{f['additions']} -{f['deletions']})")
+        self.history_detail.delete("1.0", tk.END)
+        self.history_detail.insert("1.0", "\n".join(lines))
+
+    # --- DASHBOARD ---
+    def _dashboard_repo_list(self):
+        raw = self.dashboard_text.get("1.0", tk.END)
+        repos = []
+        for line in raw.replace(",", "\n").splitlines():
+            name = line.strip().strip("/")
+            if name.count("/") == 1 and name not in repos:
+                repos.append(name)
+        return repos
+
+    def refresh_dashboard(self):
+        if not self.token_entry.get().strip():
+            messagebox.showerror("Error", "Token required!")
+            return
+        self.dashboard_repos = self._dashboard_repo_list()
+        self.save_config()
+        
+        # Keep existing rows (and their values) for repos still listed
+        for iid in self.tree_dashboard.get_children():
+            if iid not in self.dashboard_repos:
+                self.tree_dashboard.delete(iid)
+        for index, repo in enumerate(self.dashboard_repos):
+            if not self.tree_dashboard.exists(repo):
+                self.tree_dashboard.insert("", index, iid=repo, text=repo, values=("", "", "", "", "", "..."))
+            else:
+                self.tree_dashboard.move(repo, "", index)
+                self.tree_dashboard.set(repo, "status", "...")
+        
+        threading.Thread(target=self._dashboard_refresh_thread, args=(list(self.dashboard_repos),), daemon=True).start()
+
+    def _dashboard_refresh_thread(self, repos):
+        self.status_var.set(f"Refreshing {len(repos)} repositories...")
+        ok = 0
+        with ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS) as pool:
+            futures = {pool.submit(self._fetch_dashboard_row, repo): repo for repo in repos}
+            for fut in as_completed(futures):
+                repo = futures[fut]
+                try:
+                    values = fut.result()
+                    ok += 1
+                except Exception as e:
+                    values = {"status": f"Error: {e}"}
+                self.root.after(0, lambda r=repo, v=values: self._set_dashboard_row(r, v))
+        self.status_var.set(f"Dashboard refreshed: {ok}/{len(repos)} OK.")
+
+    def _fetch_dashboard_row(self, repo):
+        base = f"https://api.github.com/repos/{repo}"
+        info = self.api_request_cached(base)
+        topics = self.api_request_cached(f"{base}/topics").get("names", [])
+        try:
+            release = self.api_request_cached(f"{base}/releases/latest").get("tag_name", "")
+        except urllib.error.HTTPError as e:
+            if e.code != 404: raise
+            release = "-" # No release yet
+        return {
+            "stars": info.get("stargazers_count", 0),
+            "forks": info.get("forks_count", 0),
+            "issues": info.get("open_issues_count", 0),
+            "release": release,
+            "topics": ", ".join(topics),
+            "status": "OK"
+        }
+
+    def _set_dashboard_row(self, repo, values):
+        if not self.tree_dashboard.exists(repo): return
+        for col, val in values.items():
+            self.tree_dashboard.set(repo, col, val)
+
+    def on_dashboard_double_click(self, event):
+        sel = self.tree_dashboard.selection()
+        if not sel: return
+        self.notebook.select(self.tab_files)
+        self._set_and_connect(sel[0])
+
+    def bulk_update_topics(self, mode):
+        repos = list(self.tree_dashboard.selection())
+        if not repos:
+            messagebox.showinfo("Dashboard", "Select one or more repositories first.")
+            return
+        
+        prompts = {"add": "Topics to ADD", "remove": "Topics to REMOVE", "set": "Topics to SET (replaces existing)"}
+        raw = simpledialog.askstring("Bulk Topics", f"{prompts[mode]} on {len(repos)} repositories (comma separated):")
+        if raw is None: return
+        names = [t.strip().lower() for t in raw.split(",") if t.strip()]
+        if not names and mode != "set": return
+        
+        for repo in repos:
+            self.tree_dashboard.set(repo, "status", "Updating...")
+        threading.Thread(target=self._bulk_topics_thread, args=(repos, mode, names), daemon=True).start()
+
+    def _bulk_topics_thread(self, repos, mode, names):
+        self.status_var.set(f"Updating topics on {len(repos)} repositories...")
+        results = {}
+        
+        def _apply(repo):
+            url = f"https://api.github.com/repos/{repo}/topics"
+            current = self.api_request_cached(url).get("names", [])
+            if mode == "add":
+                new = current + [n for n in names if n not in current]
+            elif mode == "remove":
+                new = [n for n in current if n not in names]
+            else:
+                new = names
+            if new == current:
+                return current, "Unchanged"
+            res = self.api_request(url, "PUT", {"names": new})
+            return res.get("names", new), "Updated"
+        
+        with ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS) as pool:
+            futures = {pool.submit(_apply, repo): repo for repo in repos}
+            for fut in as_completed(futures):
+                repo = futures[fut]
+                try:
+                    topics, status = fut.result()
+                    values = {"topics": ", ".join(topics), "status": status}
+                except Exception as e:
+                    status = f"Error: {e}"
+                    values = {"status": status}
+                results[repo] = status
+                self.root.after(0, lambda r=repo, v=values: self._set_dashboard_row(r, v))
+        
+        failed = sum(1 for v in results.values() if v.startswith("Error"))
+        self.status_var.set(f"Bulk topics: {len(repos) - failed} OK, {failed} failed.")
+        report = "\n".join(f"{repo}: {results[repo]}" for repo in repos)
+        self.root.after(0, lambda: messagebox.showinfo("Bulk Topics", report))
+
     def open_my_github(self):
         webbrowser.open("https://github.com/CordaAvlao")
 
+    def show_profiler(self):
+        win = tk.Toplevel(self.root)
+        win.title("Profiling")
+        win.geometry("1000x600")
+        
+        top = tk.Frame(win)
+        top.pack(fill=tk.X, padx=5, pady=5)
+        tk.Label(top, text="Profile next call of:").pack(side=tk.LEFT)
+        armed_vars = {}
+        for name in PROFILE_OPERATIONS:
+            var = tk.BooleanVar(value=name in PROFILER.armed)
+            tk.Checkbutton(top, text=name, variable=var, command=lambda n=name, v=var: PROFILER.arm(n, v.get())).pack(side=tk.LEFT)
+            armed_vars[name] = var
+        
+        lag = tk.Frame(win)
+        lag.pack(fill=tk.X, padx=5)
+        lag_var = tk.BooleanVar(value=self.lag_monitor.running)
+        threshold = tk.Spinbox(lag, from_=20, to=5000, increment=10, width=6)
+        threshold.delete(0, tk.END)
+        threshold.insert(0, str(self.lag_monitor.threshold_ms))
+        
+        def _toggle_lag():
+            try:
+                self.lag_monitor.threshold_ms = max(1, int(threshold.get()))
+            except ValueError:
+                pass
+            if lag_var.get():
+                self.lag_monitor.start()
+            else:
+                self.lag_monitor.stop()
+        tk.Checkbutton(lag, text="Event loop lag monitor, record stalls above (ms):", variable=lag_var, command=_toggle_lag).pack(side=tk.LEFT)
+        threshold.pack(side=tk.LEFT)
+        tk.Label(lag, text=f"Saved to {os.path.abspath(PROFILE_DIR)}", fg="#666").pack(side=tk.RIGHT)
+        
+        paned = tk.PanedWindow(win, orient=tk.HORIZONTAL, sashrelief=tk.RAISED, sashwidth=4)
+        paned.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        results = tk.Listbox(paned, font=("Consolas", 9))
+        paned.add(results, width=380)
+        report = tk.Text(paned, wrap=tk.NONE, font=("Consolas", 9))
+        paned.add(report)
+        
+        def _show(event=None):
+            sel = results.curselection()
+            if not sel: return
+            report.delete("1.0", tk.END)
+            report.insert(tk.END, PROFILER.results[sel[0]]["report"])
+        results.bind("<<ListboxSelect>>", _show)
+        
+        def _poll():
+            # Results arrive from any thread, list new ones and uncheck the operations already captured
+            if not win.winfo_exists(): return
+            for r in PROFILER.results[results.size():]:
+                results.insert(tk.END, r["title"])
+                if r["kind"] == "stall":
+                    results.itemconfig(tk.END, fg="#cc0000")
+            for name, var in armed_vars.items():
+                if var.get() and name not in PROFILER.armed:
+                    var.set(False)
+            win.after(500, _poll)
+        _poll()
+
     def show_about(self):
         messagebox.showinfo("About", "MiniGitManager V1.7\nMade by CordaAvlao\n08/01/2026")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # Hashing workers in the packaged .exe
     app = GitHubManager()
     app.root.mainloop()
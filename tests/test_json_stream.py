@@ -0,0 +1,62 @@
+import io
+import json
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GitHubManager import JSONStreamReader
+
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(8 if depth < 3 else 6)
+    if kind == 0:
+        return rng.randint(-10**12, 10**12)
+    if kind == 1:
+        return rng.uniform(-1e6, 1e6) * 10 ** rng.randint(-20, 20)
+    if kind == 2:
+        return rng.choice([True, False, None])
+    if kind == 3:
+        return "".join(rng.choice('ab "\\\né☃/') for _ in range(rng.randrange(12)))
+    if kind == 4:
+        return -0.5
+    if kind == 5:
+        return 12345.678e-3
+    if kind == 6:
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(5))]
+    return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randrange(5))}
+
+
+class JSONStreamReaderTest(unittest.TestCase):
+    def test_numbers_across_window_edges(self):
+        for chunk in range(1, 6):
+            for doc in ([1.5, 2], [-2.5e10], [10, -3, 0.25, 1E+5], [True, None, False, 7]):
+                reader = JSONStreamReader(io.BytesIO(json.dumps(doc).encode()), chunk)
+                self.assertEqual(list(reader.iter_array()), doc, f"chunk={chunk}")
+
+    def test_random_documents_small_chunks(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            doc = [random_value(rng) for _ in range(rng.randrange(8))]
+            data = json.dumps(doc, ensure_ascii=rng.random() < 0.5).encode()
+            for chunk in (1, 2, 3, 7, 64):
+                reader = JSONStreamReader(io.BytesIO(data), chunk)
+                self.assertEqual(list(reader.iter_array()), doc, f"chunk={chunk} data={data!r}")
+
+    def test_array_under_key_and_fields(self):
+        data = json.dumps({"sha": "abc", "tree": [{"path": "a", "size": 1.5}], "truncated": False}).encode()
+        for chunk in (1, 3, 64):
+            reader = JSONStreamReader(io.BytesIO(data), chunk)
+            self.assertEqual(list(reader.iter_array("tree")), [{"path": "a", "size": 1.5}])
+            self.assertEqual(reader.fields, {"sha": "abc", "truncated": False})
+
+    def test_read_value(self):
+        doc = {"content": "x" * 100000, "sha": "abc", "n": [1, 2.5]}
+        reader = JSONStreamReader(io.BytesIO(json.dumps(doc).encode()), 3)
+        self.assertEqual(reader.read_value(), doc)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GitHubManager import PathIndex
+
+
+PATHS = [
+    "GitHubManager.py",
+    "README.md",
+    "Lancer_MiniGitManager.bat",
+    "src/gh_manager.py",
+    "src/utils/config_loader.py",
+    "docs/manager_guide.md",
+    "tests/test_manager.py",
+] + [f"pkg/module{i}/file{i}.py" for i in range(2000)]
+
+
+class PathIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = PathIndex()
+        for path in PATHS:
+            self.index.add(path)
+
+    def test_exact_name_first(self):
+        self.assertEqual(self.index.search("readme.md")[0], "README.md")
+
+    def test_prefix(self):
+        self.assertEqual(self.index.search("githubman")[0], "GitHubManager.py")
+
+    def test_substring(self):
+        self.assertIn("src/utils/config_loader.py", self.index.search("loader"))
+
+    def test_abbreviation(self):
+        # Subsequences share no trigram with the name
+        self.assertIn("GitHubManager.py", self.index.search("gmgr"))
+        self.assertIn("GitHubManager.py", self.index.search("ghm"))
+
+    def test_typo(self):
+        self.assertEqual(self.index.search("GitHubManger")[0], "GitHubManager.py")
+
+    def test_directory_filter(self):
+        self.assertEqual(self.index.search("src/mgr"), ["src/gh_manager.py"])
+
+    def test_short_query(self):
+        self.assertIn("README.md", self.index.search("re"))
+
+    def test_no_match(self):
+        self.assertEqual(self.index.search("zzqx"), [])
+
+    def test_remove_and_copy(self):
+        copy = self.index.copy()
+        copy.remove("GitHubManager.py")
+        self.assertNotIn("GitHubManager.py", copy.search("gmgr"))
+        self.assertIn("GitHubManager.py", self.index.search("gmgr"))
+        for i in range(2000):
+            copy.remove(f"pkg/module{i}/file{i}.py") # Forces a compaction
+        self.assertEqual(copy.search("file1999"), [])
+        self.assertEqual(copy.search("loader"), ["src/utils/config_loader.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()